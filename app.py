@@ -1,14 +1,37 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+import xlsxwriter
 import io
+import gzip
 from typing import List, Tuple, Optional, Dict, Any
 import difflib
 import base64
 from datetime import datetime
 import json
 import os
+import sqlite3
 import uuid
+import weakref
+import threading
+from collections import OrderedDict
+from contextlib import closing
+from functools import partial
+
+from csv_parsing import downcast_integers, read_csv_table
+
+try:
+    import orjson  # Optional: faster JSON parsing and serialization
+except ImportError:
+    orjson = None
+
+# Copy-on-write is always on from pandas 3; opt in on 2.x so shallow copies never share writes
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
 
 
 def lucide_icon(name: str, size: int = 16, color: str = "currentColor") -> str:
@@ -669,51 +692,138 @@ class CleaningConfig:
             created_at=datetime.fromisoformat(data['created_at'])
         )
 
+def estimate_memory_mb(df: pd.DataFrame, sample_size: int = 1000) -> float:
+    """Approximate in-memory size from buffer sizes, sampling object columns instead of walking every value"""
+    total = df.memory_usage(index=True, deep=False).sum()
+    for i, dtype in enumerate(df.dtypes):
+        if dtype == object and len(df):
+            sample = df.iloc[:sample_size, i]
+            extra = sample.memory_usage(index=False, deep=True) - sample.memory_usage(index=False, deep=False)
+            total += extra * len(df) / len(sample)
+    return total / 1024 / 1024
+
+def read_artifact_file(path: str) -> pd.DataFrame:
+    """Read an artifact's data file: memory-mapped Arrow IPC (.arrow, or legacy .feather) or older Parquet"""
+    if path.endswith(('.arrow', '.feather')):
+        return feather.read_feather(path, memory_map=True)
+    return pd.read_parquet(path, engine='pyarrow')
+
+class ArtifactFrameCache:
+    """LRU of loaded artifact frames, bounded by entry count and by total estimated size"""
+    
+    def __init__(self, max_entries: int = 4, max_mb: float = 500.0):
+        self.max_entries = max_entries
+        self.max_mb = max_mb
+        self._frames = OrderedDict()  # (path, mtime) -> (dataframe, size in MB)
+        self._total_mb = 0.0
+        self._lock = threading.Lock()
+    
+    def get(self, path: str, mtime: float) -> pd.DataFrame:
+        """Return the frame for a data file, reading it on a miss; mtime in the key catches rewrites"""
+        key = (path, mtime)
+        with self._lock:
+            if key in self._frames:
+                self._frames.move_to_end(key)
+                return self._frames[key][0]
+        
+        df = read_artifact_file(path)
+        size_mb = estimate_memory_mb(df)
+        with self._lock:
+            if key in self._frames:
+                self._total_mb -= self._frames[key][1]
+            self._frames[key] = (df, size_mb)
+            self._total_mb += size_mb
+            # Evict least recently used frames; their files stay on disk and are re-read on demand
+            while len(self._frames) > self.max_entries or (self._total_mb > self.max_mb and len(self._frames) > 1):
+                _, (_, evicted_mb) = self._frames.popitem(last=False)
+                self._total_mb -= evicted_mb
+        return df
+
+@st.cache_resource(show_spinner=False)
+def _artifact_frame_cache() -> ArtifactFrameCache:
+    """Process-wide frame cache shared by all sessions and reruns"""
+    return ArtifactFrameCache()
+
 class DataArtifact:
     """Class to represent a data artifact with metadata"""
     
-    def __init__(self, name: str, dataframe: pd.DataFrame, source: str, created_at: datetime = None):
+    def __init__(self, name: str, dataframe: Optional[pd.DataFrame], source: str, created_at: datetime = None,
+                 path: Optional[str] = None, rows: int = 0, columns: int = 0, memory_mb: float = 0.0):
         self.name = name
-        self.dataframe = dataframe.copy()
+        self._dataframe = dataframe  # Only held until the artifact is persisted
+        self.path = path  # Arrow IPC file holding the data once persisted
         self.source = source  # 'cleaning', 'merging', 'upload'
         self.created_at = created_at or datetime.now()
-        self.rows = len(dataframe)
-        self.columns = len(dataframe.columns)
-        self.memory_mb = dataframe.memory_usage(deep=True).sum() / 1024 / 1024
+        if dataframe is not None:
+            self.rows = len(dataframe)
+            self.columns = len(dataframe.columns)
+            self.memory_mb = estimate_memory_mb(dataframe)
+        else:
+            self.rows = rows
+            self.columns = columns
+            self.memory_mb = memory_mb
+    
+    @property
+    def dataframe(self) -> Optional[pd.DataFrame]:
+        """Artifact data, loaded from disk on demand through a small LRU cache"""
+        if self._dataframe is not None:
+            return self._dataframe
+        if self.path:
+            return _artifact_frame_cache().get(self.path, os.path.getmtime(self.path))
+        return None
+    
+    def preview(self, n: int = 20) -> Optional[pd.DataFrame]:
+        """First n rows, read straight from the data file without loading the whole artifact"""
+        if self._dataframe is not None:
+            return self._dataframe.iloc[:n]
+        if not self.path:
+            return None
+        if self.path.endswith(('.arrow', '.feather')):
+            return feather.read_table(self.path, memory_map=True).slice(0, n).to_pandas()
+        parquet_file = pq.ParquetFile(self.path)
+        first_batch = next(parquet_file.iter_batches(batch_size=n), None)
+        if first_batch is None:
+            return parquet_file.schema_arrow.empty_table().to_pandas()
+        return first_batch.to_pandas()
+    
+    def mark_persisted(self, path: str):
+        """Record the artifact's data file and release the in-memory frame"""
+        self.path = path
+        self._dataframe = None
     
     def get_summary(self) -> str:
         return f"{self.name} | {self.rows:,} rows × {self.columns} cols | {self.memory_mb:.1f}MB | {self.source}"
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert artifact to dictionary for JSON serialization"""
-        return {
-            'name': self.name,
-            'dataframe': self.dataframe.to_json(orient='records'),
-            'source': self.source,
-            'created_at': self.created_at.isoformat(),
-            'rows': self.rows,
-            'columns': self.columns,
-            'memory_mb': self.memory_mb
-        }
-    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'DataArtifact':
-        """Create artifact from dictionary"""
-        df = pd.read_json(data['dataframe'], orient='records')
-        artifact = cls(
+        """Create artifact from an entry of the legacy artifacts.json index"""
+        if 'dataframe' in data:
+            # Legacy entry with the data inlined as JSON records; re-persisted to a data file on next save
+            df = pd.read_json(io.StringIO(data['dataframe']), orient='records')
+            return cls(
+                name=data['name'],
+                dataframe=df,
+                source=data['source'],
+                created_at=datetime.fromisoformat(data['created_at'])
+            )
+        return cls(
             name=data['name'],
-            dataframe=df,
+            dataframe=None,
             source=data['source'],
-            created_at=datetime.fromisoformat(data['created_at'])
+            created_at=datetime.fromisoformat(data['created_at']),
+            path=data['path'],
+            rows=data['rows'],
+            columns=data['columns'],
+            memory_mb=data['memory_mb']
         )
-        return artifact
 
 class ArtifactManager:
     """Manages data artifacts and cleaning configurations across the application with persistent storage"""
     
     def __init__(self):
         self.artifacts_dir = "artifacts"
-        self.artifacts_file = os.path.join(self.artifacts_dir, "artifacts.json")
+        self.catalog_file = os.path.join(self.artifacts_dir, "catalog.sqlite")
+        self.legacy_artifacts_file = os.path.join(self.artifacts_dir, "artifacts.json")
         self.configs_file = os.path.join(self.artifacts_dir, "cleaning_configs.json")
         
         # Create artifacts directory if it doesn't exist
@@ -724,18 +834,49 @@ class ArtifactManager:
         self._load_artifacts()
         self._load_configs()
     
+    def _catalog(self) -> sqlite3.Connection:
+        """Open the SQLite artifact catalog, creating its table on first use"""
+        conn = sqlite3.connect(self.catalog_file)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS artifacts ("
+            "name TEXT PRIMARY KEY, path TEXT NOT NULL, source TEXT, created_at TEXT, "
+            "n_rows INTEGER, n_columns INTEGER, memory_mb REAL)"
+        )
+        return conn
+    
+    def _upsert_catalog(self, artifacts: List[DataArtifact]):
+        """Insert or replace catalog rows for the given (already persisted) artifacts"""
+        rows = [(a.name, a.path, a.source, a.created_at.isoformat(), a.rows, a.columns, a.memory_mb)
+                for a in artifacts]
+        with closing(self._catalog()) as conn, conn:
+            conn.executemany("INSERT OR REPLACE INTO artifacts VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+    
+    def _migrate_legacy_index(self):
+        """Move artifacts from the old artifacts.json index into the catalog, then retire the file"""
+        artifacts_data = self._read_json(self.legacy_artifacts_file)
+        artifacts = [DataArtifact.from_dict(data) for data in artifacts_data.values()]
+        for artifact in artifacts:
+            if not artifact.path:
+                self._write_artifact_data(artifact)
+        self._upsert_catalog(artifacts)
+        os.remove(self.legacy_artifacts_file)
+    
     def _load_artifacts(self):
-        """Load artifacts from persistent storage"""
+        """Load artifact metadata from the catalog; data files are read on demand"""
         try:
-            if os.path.exists(self.artifacts_file):
-                with open(self.artifacts_file, 'r', encoding='utf-8') as f:
-                    artifacts_data = json.load(f)
-                    artifacts = {}
-                    for name, data in artifacts_data.items():
-                        artifacts[name] = DataArtifact.from_dict(data)
-                    st.session_state.artifacts = artifacts
-            else:
-                st.session_state.artifacts = {}
+            if os.path.exists(self.legacy_artifacts_file):
+                self._migrate_legacy_index()
+            with closing(self._catalog()) as conn:
+                rows = conn.execute(
+                    "SELECT name, path, source, created_at, n_rows, n_columns, memory_mb "
+                    "FROM artifacts ORDER BY rowid"
+                ).fetchall()
+            st.session_state.artifacts = {
+                name: DataArtifact(name=name, dataframe=None, source=source,
+                                   created_at=datetime.fromisoformat(created_at), path=path,
+                                   rows=n_rows, columns=n_columns, memory_mb=memory_mb)
+                for name, path, source, created_at, n_rows, n_columns, memory_mb in rows
+            }
         except Exception as e:
             st.error(f"Failed to load artifacts: {str(e)}")
             st.session_state.artifacts = {}
@@ -744,31 +885,61 @@ class ArtifactManager:
         """Load cleaning configurations from persistent storage"""
         try:
             if os.path.exists(self.configs_file):
-                with open(self.configs_file, 'r', encoding='utf-8') as f:
-                    configs_data = json.load(f)
-                    configs = {}
-                    for name, data in configs_data.items():
-                        configs[name] = CleaningConfig.from_dict(data)
-                    st.session_state.cleaning_configs = configs
+                configs_data = self._read_json(self.configs_file)
+                configs = {}
+                for name, data in configs_data.items():
+                    configs[name] = CleaningConfig.from_dict(data)
+                st.session_state.cleaning_configs = configs
             else:
                 st.session_state.cleaning_configs = {}
         except Exception as e:
             st.error(f"Failed to load cleaning configurations: {str(e)}")
             st.session_state.cleaning_configs = {}
     
-    def _save_artifacts_to_disk(self):
-        """Save artifacts to persistent storage"""
+    def _write_json_atomic(self, path: str, data: Dict[str, Any]):
+        """Write JSON to a temporary file and move it into place so readers never see a partial file"""
+        tmp_path = f"{path}.tmp"
+        if orjson is not None:
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+        os.replace(tmp_path, path)
+    
+    def _read_json(self, path: str) -> Any:
+        """Parse a JSON file, with orjson when it is installed"""
+        with open(path, 'rb') as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    
+    def _write_artifact_data(self, artifact: DataArtifact):
+        """Write an artifact's dataframe to its own uncompressed Arrow IPC file"""
+        # Uncompressed IPC can be memory-mapped and read back without decoding, unlike Parquet
+        df = artifact.dataframe
+        if not df.columns.is_unique:
+            duplicates = sorted({str(col) for col in df.columns[df.columns.duplicated()]})
+            raise ValueError(f"duplicate column names {', '.join(duplicates)}; rename them before saving")
         try:
-            artifacts_data = {}
-            for name, artifact in st.session_state.artifacts.items():
-                artifacts_data[name] = artifact.to_dict()
-            
-            with open(self.artifacts_file, 'w', encoding='utf-8') as f:
-                json.dump(artifacts_data, f, indent=2)
-            return True
-        except Exception as e:
-            st.error(f"Failed to save artifacts to disk: {str(e)}")
-            return False
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except pa.ArrowException:
+            # Mixed-type object columns (common after unions) are stored as text, as the CSV export does
+            table = pa.Table.from_pandas(_stringify_object_columns(df), preserve_index=False)
+        path = os.path.join(self.artifacts_dir, f"{uuid.uuid4().hex}.arrow")
+        try:
+            with pa.OSFile(path, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        except Exception:
+            # Don't leave a truncated file behind
+            if os.path.exists(path):
+                os.remove(path)
+            raise
+        artifact.mark_persisted(path)
+    
+    def _remove_artifact_data(self, artifact: DataArtifact):
+        """Remove an artifact's data file from disk"""
+        if artifact.path and os.path.exists(artifact.path):
+            os.remove(artifact.path)
     
     def _save_configs_to_disk(self):
         """Save cleaning configurations to persistent storage"""
@@ -777,8 +948,7 @@ class ArtifactManager:
             for name, config in st.session_state.cleaning_configs.items():
                 configs_data[name] = config.to_dict()
             
-            with open(self.configs_file, 'w', encoding='utf-8') as f:
-                json.dump(configs_data, f, indent=2)
+            self._write_json_atomic(self.configs_file, configs_data)
             return True
         except Exception as e:
             st.error(f"Failed to save cleaning configurations to disk: {str(e)}")
@@ -787,8 +957,22 @@ class ArtifactManager:
     def save_artifact(self, artifact: DataArtifact) -> bool:
         """Save an artifact to session state and persistent storage"""
         try:
+            # New data file first, then the catalog row, and only then drop the old file, so a
+            # failure at any step leaves the previous version of the artifact intact
+            previous = st.session_state.artifacts.get(artifact.name)
+            written = not artifact.path
+            if written:
+                self._write_artifact_data(artifact)
+            try:
+                self._upsert_catalog([artifact])
+            except Exception:
+                if written:
+                    self._remove_artifact_data(artifact)
+                raise
             st.session_state.artifacts[artifact.name] = artifact
-            return self._save_artifacts_to_disk()
+            if previous is not None and previous is not artifact and previous.path != artifact.path:
+                self._remove_artifact_data(previous)
+            return True
         except Exception as e:
             st.error(f"Failed to save artifact: {str(e)}")
             return False
@@ -804,8 +988,15 @@ class ArtifactManager:
     def delete_artifact(self, name: str) -> bool:
         """Delete an artifact from session state and persistent storage"""
         if name in st.session_state.artifacts:
-            del st.session_state.artifacts[name]
-            return self._save_artifacts_to_disk()
+            try:
+                artifact = st.session_state.artifacts.pop(name)
+                self._remove_artifact_data(artifact)
+                with closing(self._catalog()) as conn, conn:
+                    conn.execute("DELETE FROM artifacts WHERE name = ?", (name,))
+                return True
+            except Exception as e:
+                st.error(f"Failed to delete artifact: {str(e)}")
+                return False
         return False
     
     def get_artifacts_by_source(self, source: str) -> List[DataArtifact]:
@@ -815,9 +1006,11 @@ class ArtifactManager:
     def clear_all_artifacts(self) -> bool:
         """Clear all artifacts from memory and disk"""
         try:
+            for artifact in st.session_state.artifacts.values():
+                self._remove_artifact_data(artifact)
             st.session_state.artifacts = {}
-            if os.path.exists(self.artifacts_file):
-                os.remove(self.artifacts_file)
+            with closing(self._catalog()) as conn, conn:
+                conn.execute("DELETE FROM artifacts")
             return True
         except Exception as e:
             st.error(f"Failed to clear artifacts: {str(e)}")
@@ -859,6 +1052,51 @@ class ArtifactManager:
             st.error(f"Failed to clear cleaning configurations: {str(e)}")
             return False
 
+@st.cache_data(max_entries=32, show_spinner=False)
+def _match_key_columns(left_columns: Tuple, right_columns: Tuple) -> Tuple[Optional[str], Optional[str]]:
+    """Best key pair for two column lists; only names are compared, so the result is cached on them"""
+    left_cols = set(left_columns)
+    right_cols = set(right_columns)
+    
+    # Find exact matches
+    exact_matches = left_cols.intersection(right_cols)
+    
+    if exact_matches:
+        priority_keys = ['id', 'ID', 'key', 'Key', 'code', 'Code', 'name', 'Name', 'email', 'Email']
+        for key in priority_keys:
+            if key in exact_matches:
+                return key, key
+        best_match = list(exact_matches)[0]
+        return best_match, best_match
+    
+    # Fuzzy matching
+    best_match = None
+    best_ratio = 0.6
+    left_names = [(col, col.lower()) for col in left_cols]
+    right_names = [(col, col.lower()) for col in right_cols]
+    
+    # One matcher for all pairs: set_seq2 indexes each right name once, set_seq1 is cheap
+    matcher = difflib.SequenceMatcher()
+    for right_col, right_name in right_names:
+        matcher.set_seq2(right_name)
+        for left_col, left_name in left_names:
+            # Cheap upper bounds first: lengths alone, then shared characters
+            total_len = len(left_name) + len(right_name)
+            if not total_len or 2 * min(len(left_name), len(right_name)) / total_len <= best_ratio:
+                continue
+            matcher.set_seq1(left_name)
+            if matcher.quick_ratio() <= best_ratio:
+                continue
+            ratio = matcher.ratio()
+            if ratio > best_ratio:
+                best_ratio = ratio
+                best_match = (left_col, right_col)
+    
+    return best_match if best_match else (None, None)
+
+# PCG64 generator for generated columns; faster than the legacy np.random global state
+_rng = np.random.default_rng()
+
 class DataProcessor:
     """Main class for handling all data processing operations"""
     
@@ -868,6 +1106,8 @@ class DataProcessor:
         self.file_names: List[str] = []
         self.merged_df: Optional[pd.DataFrame] = None
         self.cleaned_df: Optional[pd.DataFrame] = None
+        # Parsed uploads keyed by upload identity, so reruns skip re-reading unchanged files
+        self._parsed_uploads: "OrderedDict[Tuple[str, int], pd.DataFrame]" = OrderedDict()
         
     def load_files(self, uploaded_files) -> bool:
         """Load multiple CSV files"""
@@ -876,13 +1116,7 @@ class DataProcessor:
             self.file_names = []
             
             for file in uploaded_files:
-                try:
-                    df = pd.read_csv(file, encoding='utf-8')
-                except UnicodeDecodeError:
-                    file.seek(0)
-                    df = pd.read_csv(file, encoding='latin1')
-                
-                df.columns = df.columns.str.strip()
+                df = self.read_uploaded_csv(file)
                 self.dataframes.append(df)
                 self.file_names.append(file.name)
                 
@@ -891,6 +1125,75 @@ class DataProcessor:
             st.error(f"Error loading files: {str(e)}")
             return False
     
+    def load_file_at(self, position: int, uploaded_file) -> bool:
+        """Load one uploaded CSV into the given slot, leaving the other slots untouched"""
+        try:
+            df = self.read_uploaded_csv(uploaded_file)
+        except Exception as e:
+            st.error(f"Error loading file: {str(e)}")
+            return False
+        
+        if position >= len(self.dataframes):
+            self.dataframes.extend([None] * (position - len(self.dataframes) + 1))
+            self.file_names.extend([''] * (position - len(self.file_names) + 1))
+        
+        self.dataframes[position] = df
+        self.file_names[position] = uploaded_file.name
+        return True
+    
+    def read_uploaded_csv(self, file) -> pd.DataFrame:
+        """Parse one uploaded CSV into a compact DataFrame, reusing the parse while the upload is unchanged"""
+        file_id = getattr(file, 'file_id', None)
+        if file_id is None:
+            return downcast_integers(self._read_csv(file))
+        
+        key = (file_id, file.size)
+        df = self._parsed_uploads.get(key)
+        if df is None:
+            df = downcast_integers(self._read_csv(file))
+            self._parsed_uploads[key] = df
+            while len(self._parsed_uploads) > 8:
+                self._parsed_uploads.popitem(last=False)
+        else:
+            self._parsed_uploads.move_to_end(key)
+        return df
+    
+    def _compact_result(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Narrow integers and move pure-text object columns to Arrow-backed strings, in place"""
+        downcast_integers(df)
+        for i, dtype in enumerate(df.dtypes):
+            if dtype == object and pd.api.types.infer_dtype(df.iloc[:, i], skipna=True) == 'string':
+                df.isetitem(i, df.iloc[:, i].astype('string[pyarrow]'))
+        return df
+    
+    def _read_csv(self, file) -> pd.DataFrame:
+        """Parse a CSV upload in one pass with Arrow's multithreaded reader, falling back to pandas"""
+        raw = file.getvalue()
+        try:
+            raw.decode('utf-8')  # validation only; far cheaper than a second full parse
+            encoding = 'utf8'
+        except UnicodeDecodeError:
+            encoding = 'latin1'
+        
+        table = read_csv_table(raw, encoding)
+        if table is not None:
+            table = table.rename_columns([name.strip() for name in table.column_names])
+            # Keep numeric columns NumPy-backed; only text goes to Arrow-backed strings
+            string_types = {pa.string(): pd.StringDtype('pyarrow'), pa.large_string(): pd.StringDtype('pyarrow')}
+            # split_blocks + self_destruct free each Arrow column as soon as it has been converted
+            return table.to_pandas(types_mapper=string_types.get, split_blocks=True, self_destruct=True)
+        
+        # Arrow rejects some files pandas tolerates (e.g. rows with missing fields)
+        df = pd.read_csv(io.BytesIO(raw), encoding='utf-8' if encoding == 'utf8' else 'latin1')
+        self._strip_column_names(df)
+        return df
+    
+    def _strip_column_names(self, df: pd.DataFrame):
+        """Strip surrounding whitespace from string column names, in place"""
+        # A plain comprehension skips the .str accessor machinery, and leaves non-string labels
+        # alone where .str.strip() would turn them into NaN
+        df.columns = [col.strip() if isinstance(col, str) else col for col in df.columns]
+    
     def load_artifact_as_dataframe(self, artifact_name: str, position: int = 0) -> bool:
         """Load an artifact as a dataframe for processing"""
         artifact = self.artifact_manager.get_artifact(artifact_name)
@@ -899,7 +1202,7 @@ class DataProcessor:
                 self.dataframes.extend([None] * (position - len(self.dataframes) + 1))
                 self.file_names.extend([''] * (position - len(self.file_names) + 1))
             
-            self.dataframes[position] = artifact.dataframe.copy()
+            self.dataframes[position] = artifact.dataframe.copy(deep=False)
             self.file_names[position] = f"Artifact: {artifact_name}"
             return True
         return False
@@ -969,7 +1272,7 @@ class DataProcessor:
                 st.info(f"✅ Detected {detected_sep}-separated format")
             
             # Clean column names
-            df.columns = df.columns.str.strip()
+            self._strip_column_names(df)
             
             # Remove any completely empty columns that might have been created
             df = df.dropna(axis=1, how='all')
@@ -1065,29 +1368,42 @@ class DataProcessor:
         """Add a new column to the DataFrame based on specified rules."""
         if col_name in df.columns:
             st.warning(f"Column '{col_name}' already exists. Overwriting.")
+        # Work on a shallow copy (copy-on-write) so the caller gets a new frame object and caches keyed
+        # on frame identity, like the source previews, never see a frame change underneath them
+        df = df.copy(deep=False)
 
         if col_type == "Autonumber":
             start = kwargs.get('autonum_start', 1)
-            df[col_name] = range(start, start + len(df))
+            stop = start + len(df)
+            dtype = np.int32 if stop <= np.iinfo(np.int32).max else np.int64
+            df[col_name] = np.arange(start, stop, dtype=dtype)
         elif col_type == "Fixed Value":
             fixed_value = kwargs.get('fixed_value', '')
             df[col_name] = fixed_value
         elif col_type == "Random Integer":
             min_val = kwargs.get('random_int_min', 0)
             max_val = kwargs.get('random_int_max', 100)
-            df[col_name] = np.random.randint(min_val, max_val + 1, size=len(df))
+            int32 = np.iinfo(np.int32)
+            dtype = np.int32 if int32.min <= min_val and max_val < int32.max else np.int64
+            df[col_name] = _rng.integers(min_val, max_val + 1, size=len(df), dtype=dtype)
         elif col_type == "Random Float":
             min_val = kwargs.get('random_float_min', 0.0)
             max_val = kwargs.get('random_float_max', 1.0)
-            df[col_name] = np.random.uniform(min_val, max_val, size=len(df))
+            df[col_name] = _rng.uniform(min_val, max_val, size=len(df))
         elif col_type == "UUID7":
             df[col_name] = [str(uuid.uuid4()) for _ in range(len(df))]
         elif col_type == "Increment Existing":
             source_col = kwargs.get('source_column')
             increment_by = kwargs.get('increment_by', 1)
             if source_col and source_col in df.columns:
-                if pd.api.types.is_numeric_dtype(df[source_col]):
-                    df[col_name] = df[source_col] + increment_by
+                source = df[source_col]
+                if isinstance(source.dtype, np.dtype) and source.dtype.kind in 'iuf':
+                    # Plain numpy column: one vectorised ufunc call, no Series dispatch or alignment.
+                    # Integers are widened to 64 bits so downcast int32 columns cannot wrap around.
+                    dtype = np.result_type(source.dtype, np.int64) if source.dtype.kind in 'iu' else None
+                    df[col_name] = np.add(source.to_numpy(), increment_by, dtype=dtype)
+                elif pd.api.types.is_numeric_dtype(source):
+                    df[col_name] = source + increment_by
                 else:
                     st.error(f"Source column '{source_col}' is not numeric for 'Increment Existing'.")
                     return df
@@ -1106,61 +1422,115 @@ class DataProcessor:
             self.dataframes[left_idx] is None or self.dataframes[right_idx] is None):
             return None, None
             
-        left_cols = set(self.dataframes[left_idx].columns)
-        right_cols = set(self.dataframes[right_idx].columns)
+        return _match_key_columns(tuple(self.dataframes[left_idx].columns),
+                                  tuple(self.dataframes[right_idx].columns))
+    
+    def _project_columns(self, df: pd.DataFrame, key: str, columns: Optional[List[str]]) -> pd.DataFrame:
+        """Return a copy of df restricted to the join key plus the selected columns"""
+        if columns is None:
+            return df.copy(deep=False)
+        keep = set(columns)
+        keep.add(key)
+        return df.reindex(columns=[col for col in df.columns if col in keep])
+    
+    def _stack_same_schema(self, left_df: pd.DataFrame, right_df: pd.DataFrame) -> pd.DataFrame:
+        """Stack two frames with identical columns, concatenating numeric columns directly with numpy"""
+        stacked = {}
+        for col in left_df.columns:
+            left_col, right_col = left_df[col], right_df[col]
+            if (left_col.dtype == right_col.dtype and isinstance(left_col.dtype, np.dtype)
+                    and left_col.dtype.kind in 'biufcmM'):
+                stacked[col] = np.concatenate([left_col.to_numpy(), right_col.to_numpy()])
+            else:
+                stacked[col] = pd.concat([left_col, right_col], ignore_index=True)
+        return pd.DataFrame(stacked, copy=False)
+    
+    def _merge_on_key(self, left_df: pd.DataFrame, right_df: pd.DataFrame, on: str, how: str) -> pd.DataFrame:
+        """Merge two frames on a shared key column, picking the cheapest strategy for the keys"""
+        suffixes = ('_left', '_right')
+        # Left and right joins keep the order of the preserved side whichever frame is passed first;
+        # inner joins follow the first frame's order, so they are never swapped
+        swapped_how = {'left': 'right', 'right': 'left'}
         
-        # Find exact matches
-        exact_matches = left_cols.intersection(right_cols)
+        left_keys, right_keys = left_df[on], right_df[on]
+        integer_keys = (isinstance(left_keys.dtype, np.dtype) and left_keys.dtype.kind in 'iu' and
+                        isinstance(right_keys.dtype, np.dtype) and right_keys.dtype.kind in 'iu')
         
-        if exact_matches:
-            priority_keys = ['id', 'ID', 'key', 'Key', 'code', 'Code', 'name', 'Name', 'email', 'Email']
-            for key in priority_keys:
-                if key in exact_matches:
-                    return key, key
-            best_match = list(exact_matches)[0]
-            return best_match, best_match
+        if (integer_keys and left_keys.is_monotonic_increasing and right_keys.is_monotonic_increasing and
+                left_keys.is_unique and right_keys.is_unique):
+            # Sorted unique keys: an index join walks both sides linearly without building a hash table
+            merged = left_df.set_index(on).join(right_df.set_index(on), how=how,
+                                                lsuffix=suffixes[0], rsuffix=suffixes[1]).reset_index()
+            return merged[self._merged_columns(left_df, right_df, on, how)]
         
-        # Fuzzy matching
-        best_match = None
-        best_ratio = 0.6
+        if integer_keys and how == 'inner' and len(right_df) < 100_000:
+            # Small right side: drop non-matching left rows with a vectorized membership
+            # test before the full merge
+            left_df = left_df[np.isin(left_keys.to_numpy(), right_keys.to_numpy())]
         
-        for left_col in left_cols:
-            for right_col in right_cols:
-                ratio = difflib.SequenceMatcher(None, left_col.lower(), right_col.lower()).ratio()
-                if ratio > best_ratio:
-                    best_ratio = ratio
-                    best_match = (left_col, right_col)
+        if how not in swapped_how or len(left_df) >= len(right_df):
+            return pd.merge(left_df, right_df, on=on, how=how, suffixes=suffixes)
         
-        return best_match if best_match else (None, None)
+        # Put the smaller frame on the build (right) side of the hash join
+        merged = pd.merge(right_df, left_df, on=on, how=swapped_how[how], suffixes=suffixes[::-1])
+        return merged[self._merged_columns(left_df, right_df, on, how)]
+    
+    def _is_text(self, column: pd.Series) -> bool:
+        """True for object or pandas string columns"""
+        return column.dtype == object or isinstance(column.dtype, pd.StringDtype)
+    
+    def _merged_columns(self, left_df: pd.DataFrame, right_df: pd.DataFrame, on: str, how: str) -> pd.Index:
+        """Column layout pd.merge would produce for these frames"""
+        return pd.merge(left_df.iloc[:0], right_df.iloc[:0], on=on, how=how, suffixes=('_left', '_right')).columns
     
-    def merge_dataframes(self, left_idx: int, right_idx: int, left_key: str, right_key: str, join_type: str) -> bool:
-        """Merge two dataframes"""
+    def merge_dataframes(self, left_idx: int, right_idx: int, left_key: str, right_key: str, join_type: str,
+                         left_columns: Optional[List[str]] = None, right_columns: Optional[List[str]] = None) -> bool:
+        """Merge two dataframes, optionally restricted to a subset of columns from each side"""
         try:
             if (left_idx >= len(self.dataframes) or right_idx >= len(self.dataframes) or
                 self.dataframes[left_idx] is None or self.dataframes[right_idx] is None):
                 st.error("Invalid dataframe indices or missing dataframes")
                 return False
-                
-            left_df = self.dataframes[left_idx].copy()
-            right_df = self.dataframes[right_idx].copy()
+            
+            # Drop unneeded columns before merging so they are never copied into the result
+            left_df = self._project_columns(self.dataframes[left_idx], left_key, left_columns)
+            right_df = self._project_columns(self.dataframes[right_idx], right_key, right_columns)
             
             if left_key != right_key:
-                left_df['_join_key'] = left_df[left_key]
-                right_df['_join_key'] = right_df[right_key]
+                left_keys, right_keys = left_df[left_key], right_df[right_key]
+                if self._is_text(left_keys) and self._is_text(right_keys):
+                    # The helper key is dropped after the merge, so join on shared integer codes
+                    # instead of hashing the strings again inside pd.merge. Sorted codes keep the
+                    # key order of outer joins.
+                    try:
+                        codes, _ = pd.factorize(pd.concat([left_keys, right_keys], ignore_index=True),
+                                                sort=True, use_na_sentinel=False)
+                        left_keys, right_keys = codes[:len(left_df)], codes[len(left_df):]
+                    except TypeError:
+                        pass  # unorderable mixed-type keys: merge on the raw values
+                left_df['_join_key'] = left_keys
+                right_df['_join_key'] = right_keys
                 join_on = '_join_key'
             else:
                 join_on = left_key
             
-            if join_type == "union":
-                all_cols = list(set(left_df.columns) | set(right_df.columns))
-                left_aligned = left_df.reindex(columns=all_cols, fill_value='')
-                right_aligned = right_df.reindex(columns=all_cols, fill_value='')
-                self.merged_df = pd.concat([left_aligned, right_aligned], ignore_index=True)
+            if join_type == "union" and left_df.columns.is_unique and set(left_df.columns) == set(right_df.columns):
+                # Same schema: no column alignment needed, stack column by column
+                self.merged_df = self._stack_same_schema(left_df, right_df)
+            elif join_type == "union":
+                # concat aligns the columns itself; missing cells become NaN, so dtypes survive
+                self.merged_df = pd.concat([left_df, right_df], ignore_index=True, join='outer')
+                one_sided = left_df.columns.symmetric_difference(right_df.columns)
+                text_cols = self.merged_df.select_dtypes(include=['object', 'string']).columns
+                fill_cols = [col for col in one_sided if col in text_cols]
+                if fill_cols:
+                    self.merged_df[fill_cols] = self.merged_df[fill_cols].fillna('')
             else:
-                self.merged_df = pd.merge(left_df, right_df, on=join_on, how=join_type, suffixes=('_left', '_right'))
+                self.merged_df = self._merge_on_key(left_df, right_df, join_on, join_type)
             
             if left_key != right_key and '_join_key' in self.merged_df.columns:
                 self.merged_df = self.merged_df.drop('_join_key', axis=1)
+            self._compact_result(self.merged_df)
             
             return True
         except Exception as e:
@@ -1261,7 +1631,7 @@ class DataProcessor:
             else:
                 # Work with first valid dataframe if no merge
                 valid_df = next((df for df in self.dataframes if df is not None), None)
-                self.cleaned_df = valid_df.copy() if valid_df is not None else None
+                self.cleaned_df = valid_df.copy(deep=False) if valid_df is not None else None
             
             if self.cleaned_df is not None:
                 # Apply column renaming FIRST (before column selection)
@@ -1319,29 +1689,47 @@ class DataProcessor:
                 else:
                     st.info("ℹ️ No column filtering applied - all columns retained.")
 
-                # Apply other cleaning operations
-                if options.get('remove_duplicates', False):
-                    self.cleaned_df.drop_duplicates(inplace=True)
+                # Apply other cleaning operations as one row mask and one column mask, selected once
+                row_mask = np.ones(len(self.cleaned_df), dtype=bool)
+                col_mask = np.ones(len(self.cleaned_df.columns), dtype=bool)
+                remove_empty_rows = options.get('remove_empty_rows', True)
+                remove_empty_columns = options.get('remove_empty_columns', False)
+                if remove_empty_rows or remove_empty_columns:
+                    valid = self.cleaned_df.notna().to_numpy()
+                    if remove_empty_rows:
+                        row_mask &= valid.any(axis=1)
+                    if remove_empty_columns:
+                        col_mask &= valid.any(axis=0)
                 
-                if options.get('remove_empty_rows', True):
-                    self.cleaned_df.dropna(how='all', inplace=True)
-                
-                if options.get('remove_empty_columns', False):
-                    self.cleaned_df.dropna(axis=1, how='all', inplace=True)
+                if options.get('remove_duplicates', False):
+                    row_mask &= ~self.cleaned_df.duplicated().to_numpy()
                 
-                if options.get('strip_whitespace', True):
-                    for col in self.cleaned_df.select_dtypes(include=['object']).columns:
-                        self.cleaned_df[col] = self.cleaned_df[col].astype(str).str.strip()
+                if not (row_mask.all() and col_mask.all()):
+                    self.cleaned_df = self.cleaned_df.iloc[row_mask, col_mask]
                 
-                if options.get('standardize_case', False):
-                    case_option = options.get('case_type', 'lower')
-                    for col in self.cleaned_df.select_dtypes(include=['object']).columns:
+                strip_whitespace = options.get('strip_whitespace', True)
+                standardize_case = options.get('standardize_case', False)
+                text_cols = self.cleaned_df.select_dtypes(include=['object', 'string']).columns
+                if (strip_whitespace or standardize_case) and len(text_cols) > 0:
+                    # Arrow-backed strings run the .str methods as vectorized kernels
+                    text_df = self.cleaned_df[text_cols].astype('string[pyarrow]')
+                    
+                    if strip_whitespace:
+                        text_df = text_df.apply(lambda s: s.str.strip())
+                    
+                    if standardize_case:
+                        case_option = options.get('case_type', 'lower')
                         if case_option == 'lower':
-                            self.cleaned_df[col] = self.cleaned_df[col].astype(str).str.lower()
+                            text_df = text_df.apply(lambda s: s.str.lower())
                         elif case_option == 'upper':
-                            self.cleaned_df[col] = self.cleaned_df[col].astype(str).str.upper()
+                            text_df = text_df.apply(lambda s: s.str.upper())
                         elif case_option == 'title':
-                            self.cleaned_df[col] = self.cleaned_df[col].astype(str).str.title()
+                            text_df = text_df.apply(lambda s: s.str.title())
+                    
+                    self.cleaned_df[text_cols] = text_df
+                
+                # New columns and concatenation can reintroduce int64 and object columns
+                self._compact_result(self.cleaned_df)
             
             return True
         except Exception as e:
@@ -1443,7 +1831,7 @@ def render_artifact_manager(artifact_manager: ArtifactManager):
                         new_name = f"{artifact_name}_copy_{datetime.now().strftime('%H%M%S')}"
                         new_artifact = DataArtifact(
                             name=new_name,
-                            dataframe=artifact.dataframe.copy(),
+                            dataframe=artifact.dataframe.copy(deep=False),
                             source=artifact.source
                         )
                         if artifact_manager.save_artifact(new_artifact):
@@ -1473,11 +1861,11 @@ def render_artifact_manager(artifact_manager: ArtifactManager):
                         with col1:
                             if st.button("◆ Save", key="save_rename", type="primary", use_container_width=True):
                                 if new_name.strip() and new_name.strip() != artifact_name:
-                                    if new_name.strip() not in artifact_manager.list_artifacts():
+                                    if artifact_manager.get_artifact(new_name.strip()) is None:
                                         # Create new artifact with new name
                                         new_artifact = DataArtifact(
                                             name=new_name.strip(),
-                                            dataframe=artifact.dataframe.copy(),
+                                            dataframe=artifact.dataframe.copy(deep=False),
                                             source=artifact.source,
                                             created_at=artifact.created_at
                                         )
@@ -1517,7 +1905,7 @@ def render_artifact_manager(artifact_manager: ArtifactManager):
                         """)
                         
                         st.markdown("**Data Preview:**")
-                        st.dataframe(artifact.dataframe.head(20), use_container_width=True)
+                        st.dataframe(artifact.preview(20), use_container_width=True)
                         
                         if st.button("◇ Close", key="close_preview", type="primary", use_container_width=True):
                             st.session_state[f"show_popup_{artifact_name}"] = False
@@ -1695,18 +2083,231 @@ def render_artifact_manager(artifact_manager: ArtifactManager):
             </div>
             """, unsafe_allow_html=True)
 
-@st.cache_data
+@st.cache_resource
+def _frame_registry() -> Dict[int, Tuple[weakref.ref, str]]:
+    """Process-wide table backing frame_token"""
+    return {}
+
+def frame_token(df: pd.DataFrame) -> str:
+    """Identity token for a DataFrame object; unlike id(), never reused by a later frame"""
+    registry = _frame_registry()
+    key = id(df)
+    entry = registry.get(key)
+    if entry is None or entry[0]() is not df:
+        entry = (weakref.ref(df, lambda _, key=key: registry.pop(key, None)), uuid.uuid4().hex)
+        registry[key] = entry
+    return entry[1]
+
+def _stringify_object_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Render object columns as text the way to_csv would, leaving missing values null"""
+    df = df.copy(deep=False)
+    for i, dtype in enumerate(df.dtypes):
+        if dtype == object:
+            column = df.iloc[:, i]
+            df.isetitem(i, column.map(str).where(column.notna(), None))
+    return df
+
+def _arrow_csv_compatible(df: pd.DataFrame) -> bool:
+    """True when Arrow's CSV writer formats every column exactly as DataFrame.to_csv would"""
+    # Arrow writes floats, booleans, datetimes and timedeltas differently (1 vs 1.0, true vs True,
+    # trailing .000000, bare integers for durations), so only integer and text columns qualify.
+    # A single-column row holding an empty field is written as "" by to_csv, so require two columns
+    if df.shape[1] < 2 or not df.columns.is_unique:
+        return False
+    for i, dtype in enumerate(df.dtypes):
+        if isinstance(dtype, pd.StringDtype) or pd.api.types.is_integer_dtype(dtype):
+            continue
+        if dtype == object and pd.api.types.infer_dtype(df.iloc[:, i], skipna=True) == 'string':
+            continue
+        return False
+    return True
+
+def _write_csv(df) -> bytes:
+    """Write CSV with Arrow's multithreaded writer where its output matches to_csv, else with pandas"""
+    if _arrow_csv_compatible(df):
+        sink = pa.BufferOutputStream()
+        try:
+            # Arrow quotes every string (headers included) unless quoting is off, and 'none' raises
+            # on values holding a delimiter, quote or line break - exactly the ones to_csv would quote
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            pacsv.write_csv(table, sink, pacsv.WriteOptions(include_header=False, quoting_style='none'))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+        else:
+            return df.iloc[:0].to_csv(index=False).encode('utf-8') + sink.getvalue().to_pybytes()
+    return df.to_csv(index=False).encode('utf-8')
+
+def _write_csv_gz(df) -> bytes:
+    """Gzip the (cached) CSV payload"""
+    # Level 1 is near line-rate and still shrinks text-heavy CSVs several times over
+    return gzip.compress(convert_df_to_csv(df), compresslevel=1)
+
+def _write_parquet(df) -> bytes:
+    """Write zstd-compressed Parquet"""
+    try:
+        output = io.BytesIO()
+        df.to_parquet(output, engine='pyarrow', compression='zstd', compression_level=3, index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed-type object columns (common after unions): stringify only those columns
+        output = io.BytesIO()
+        _stringify_object_columns(df).to_parquet(output, engine='pyarrow', compression='zstd',
+                                                 compression_level=3, index=False)
+    return output.getvalue()
+
+EXCEL_MAX_ROWS = 1_048_576
+
+def _write_excel(df, chunk_rows: int = 10_000) -> bytes:
+    """Write a single-sheet Excel workbook, streamed row by row so only the current row is held in memory"""
+    if len(df) + 1 > EXCEL_MAX_ROWS:
+        raise ValueError(f"{len(df):,} rows do not fit in an Excel sheet (max {EXCEL_MAX_ROWS - 1:,})")
+    output = io.BytesIO()
+    # constant_memory flushes each row as soon as the next one starts, so rows must be written in order
+    # (pandas' to_excel writes column by column, which is why this doesn't go through pd.ExcelWriter)
+    workbook = xlsxwriter.Workbook(output, {
+        'constant_memory': True,
+        'strings_to_formulas': False,
+        'strings_to_urls': False,
+        'remove_timezone': True,
+        'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+    })
+    sheet = workbook.add_worksheet('Processed Data')
+    header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+    sheet.write_row(0, 0, [str(col) for col in df.columns], header_format)
+    
+    float_cols = [i for i, dtype in enumerate(df.dtypes) if pd.api.types.is_float_dtype(dtype)]
+    row_num = 1
+    for start in range(0, len(df), chunk_rows):
+        chunk = df.iloc[start:start + chunk_rows]
+        # Python scalars with missing values as None, which xlsxwriter leaves as empty cells
+        values = chunk.astype(object).where(chunk.notna(), None)
+        for i in float_cols:
+            # xlsxwriter rejects ±inf, so write them as text like to_excel's default inf_rep
+            numbers = chunk.iloc[:, i].to_numpy(dtype=float, na_value=np.nan)
+            is_inf = np.isinf(numbers)
+            if is_inf.any():
+                values.iloc[is_inf, i] = np.where(numbers[is_inf] > 0, 'inf', '-inf')
+        for row in values.itertuples(index=False, name=None):
+            sheet.write_row(row_num, 0, row)
+            row_num += 1
+    workbook.close()
+    return output.getvalue()
+
+def _json_default(value):
+    """orjson fallback for values it doesn't serialise natively (pandas Timestamps, Decimals, ...)"""
+    return value.isoformat() if hasattr(value, 'isoformat') else str(value)
+
+def _write_json(df, chunk_rows: int = 50_000) -> bytes:
+    """Write the frame as an indented JSON array of records"""
+    if orjson is None or not df.columns.is_unique:
+        return df.to_json(orient='records', indent=2, date_format='iso').encode('utf-8')
+    if not len(df):
+        return b'[]'
+    # Datetimes and timedeltas are formatted by pandas so both paths write the same ISO strings
+    temporal = [i for i, dtype in enumerate(df.dtypes)
+                if pd.api.types.is_datetime64_any_dtype(dtype) or pd.api.types.is_timedelta64_dtype(dtype)]
+    # Encode in row chunks so only one chunk of Python records exists at a time, then splice the
+    # chunk arrays into a single array
+    option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    parts = []
+    for start in range(0, len(df), chunk_rows):
+        chunk = df.iloc[start:start + chunk_rows]
+        values = chunk.astype(object).where(chunk.notna(), None)
+        if temporal:
+            iso = orjson.loads(chunk.iloc[:, temporal].to_json(orient='values', date_format='iso'))
+            values.iloc[:, temporal] = pd.DataFrame(iso, index=values.index, dtype=object)
+        records = values.to_dict(orient='records')
+        parts.append(orjson.dumps(records, option=option, default=_json_default)[2:-2])
+    return b'[\n' + b',\n'.join(parts) + b'\n]'
+
+_WRITERS = {
+    'csv': _write_csv,
+    'csv_gz': _write_csv_gz,
+    'parquet': _write_parquet,
+    'excel': _write_excel,
+    'json': _write_json
+}
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _serialize_cached(token: str, fmt: str, _df: pd.DataFrame) -> bytes:
+    """Serialize a DataFrame once per (frame, format); the frame itself is never hashed"""
+    return _WRITERS[fmt](_df)
+
 def convert_df_to_csv(df):
-    """Convert DataFrame to CSV string with caching"""
-    return df.to_csv(index=False)
+    """Convert DataFrame to CSV bytes with caching"""
+    return _serialize_cached(frame_token(df), 'csv', df)
+
+def convert_df_to_csv_gz(df):
+    """Convert DataFrame to gzip-compressed CSV bytes with caching"""
+    return _serialize_cached(frame_token(df), 'csv_gz', df)
+
+def convert_df_to_parquet(df):
+    """Convert DataFrame to Parquet bytes with caching"""
+    return _serialize_cached(frame_token(df), 'parquet', df)
 
-@st.cache_data
 def convert_df_to_excel(df):
     """Convert DataFrame to Excel bytes with caching"""
-    output = io.BytesIO()
-    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-        df.to_excel(writer, sheet_name='Processed Data', index=False)
-    return output.getvalue()
+    return _serialize_cached(frame_token(df), 'excel', df)
+
+def convert_df_to_json(df):
+    """Convert DataFrame to JSON records bytes with caching"""
+    return _serialize_cached(frame_token(df), 'json', df)
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _stats_cached(token: str, _df: pd.DataFrame) -> Tuple[int, int, float]:
+    """Rows, columns and memory estimate keyed on the frame token; the frame itself is never hashed"""
+    return len(_df), len(_df.columns), estimate_memory_mb(_df)
+
+def frame_stats(df: pd.DataFrame) -> Tuple[int, int, float]:
+    """Rows, columns and estimated memory for the metrics row, computed once per frame"""
+    return _stats_cached(frame_token(df), df)
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _head_cached(token: str, n: int, _df: pd.DataFrame) -> pd.DataFrame:
+    """First n rows keyed on the frame token; the frame itself is never hashed"""
+    return _df.iloc[:n].reset_index(drop=True)
+
+def head_preview(df: pd.DataFrame, n: int = 10) -> pd.DataFrame:
+    """Cached head() of a source frame for the preview expanders"""
+    return _head_cached(frame_token(df), n, df)
+
+def render_paginated(df: pd.DataFrame, key: str, page_size: int = 20):
+    """Show one page of a result frame; only that slice is serialized to the browser"""
+    pages = max(1, -(-len(df) // page_size))
+    page = 1
+    if pages > 1:
+        page = st.number_input(f"Page (of {pages:,})", min_value=1, max_value=pages, value=1, step=1, key=key)
+    start = (page - 1) * page_size
+    st.dataframe(df.iloc[start:start + page_size], use_container_width=True)
+
+def _frame_schema(df: pd.DataFrame) -> Tuple[Tuple[Any, bool], ...]:
+    """Column names paired with a numeric flag, used as a cheap hashable cache key"""
+    numeric = set(df.select_dtypes(include=np.number).columns)
+    return tuple((col, col in numeric) for col in df.columns)
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cleaning_column_lists(schemas: Tuple, merge_files: bool,
+                           keep_first_header_only: bool) -> Tuple[List[Any], Optional[List[Any]]]:
+    """Selectable and numeric columns for the cleaning widgets, derived from schemas without concatenating data.
+
+    The numeric list is None when there is no working data to add columns to.
+    """
+    if merge_files and len(schemas) > 1:
+        valid = [schema for schema in schemas if schema is not None]
+        selectable = sorted({col for schema in valid for col, _ in schema})
+        if len(valid) < 2:
+            return selectable, None
+        if keep_first_header_only:
+            first_cols = {col for col, _ in valid[0]}
+            valid = [valid[0]] + [tuple(c for c in schema if c[0] in first_cols) for schema in valid[1:]]
+        # A concatenated column stays numeric only if every frame that has it is numeric
+        numeric = {}
+        for schema in valid:
+            for col, is_numeric in schema:
+                numeric[col] = numeric.get(col, True) and is_numeric
+        return selectable, [col for col, is_numeric in numeric.items() if is_numeric]
+    if schemas and schemas[0] is not None:
+        return [col for col, _ in schemas[0]], [col for col, is_numeric in schemas[0] if is_numeric]
+    return [], None
 
 def render_data_cleaning_tool(processor: DataProcessor, artifact_manager: ArtifactManager):
     """Render the data cleaning interface"""
@@ -1760,7 +2361,7 @@ def render_data_cleaning_tool(processor: DataProcessor, artifact_manager: Artifa
                 for artifact_name in selected_artifacts:
                     artifact = artifact_manager.get_artifact(artifact_name)
                     if artifact:
-                        processor.dataframes.append(artifact.dataframe.copy())
+                        processor.dataframes.append(artifact.dataframe.copy(deep=False))
                         processor.file_names.append(f"Artifact: {artifact_name}")
                 
                 if processor.dataframes:
@@ -1819,18 +2420,11 @@ def render_data_cleaning_tool(processor: DataProcessor, artifact_manager: Artifa
                 else:
                     case_type = "lower"
 
-            # Calculate columns available for selection based on merge preference
-            current_columns_for_selection = []
-            if merge_files and len(processor.dataframes) > 1:
-                # Calculate the union of columns across all dataframes if merging is active
-                all_cols_set = set()
-                for df in processor.dataframes:
-                    if df is not None:
-                        all_cols_set.update(df.columns)
-                current_columns_for_selection = sorted(list(all_cols_set))
-            elif len(processor.dataframes) > 0 and processor.dataframes[0] is not None:
-                # Use columns from the first dataframe if no merge
-                current_columns_for_selection = list(processor.dataframes[0].columns)
+            # Calculate columns available for selection based on merge preference (cached per schema)
+            schemas = tuple(_frame_schema(df) if df is not None else None for df in processor.dataframes)
+            current_columns_for_selection, numeric_columns = _cleaning_column_lists(
+                schemas, merge_files, keep_first_header_only
+            )
 
             # NEW: Column Renaming section (before column management)
             with st.expander("Column Renaming", expanded=False):
@@ -1943,21 +2537,7 @@ def render_data_cleaning_tool(processor: DataProcessor, artifact_manager: Artifa
             with st.expander("Add New Columns", expanded=False):
                 st.info("Add new columns to your data. These will be included in the final cleaned dataset.")
                 
-                # Get the working dataframe for adding columns
-                working_df = None
-                if merge_files and len(processor.dataframes) > 1:
-                    # If merging, work with a temporary merged version
-                    valid_dfs = [df for df in processor.dataframes if df is not None]
-                    if len(valid_dfs) >= 2:
-                        if keep_first_header_only:
-                            for i in range(1, len(valid_dfs)):
-                                common_cols = valid_dfs[0].columns.intersection(valid_dfs[i].columns)
-                                valid_dfs[i] = valid_dfs[i][common_cols]
-                        working_df = pd.concat(valid_dfs, ignore_index=True, join='outer')
-                elif len(processor.dataframes) > 0 and processor.dataframes[0] is not None:
-                    working_df = processor.dataframes[0].copy()
-                
-                if working_df is not None:
+                if numeric_columns is not None:
                     counter = st.session_state.get('add_column_counter', 0)
                     new_col_name = st.text_input("New Column Name:", key=f"new_col_name_pre_clean_{counter}")
                     col_type = st.selectbox(
@@ -1981,9 +2561,8 @@ def render_data_cleaning_tool(processor: DataProcessor, artifact_manager: Artifa
                     elif col_type == "UUID7":
                         st.info("UUID7 will generate unique identifiers for each row")
                     elif col_type == "Increment Existing":
-                        numeric_cols = working_df.select_dtypes(include=np.number).columns.tolist()
-                        if numeric_cols:
-                            col_kwargs['source_column'] = st.selectbox("Select Numeric Source Column:", [""] + numeric_cols, key="source_col_increment_pre_clean")
+                        if numeric_columns:
+                            col_kwargs['source_column'] = st.selectbox("Select Numeric Source Column:", [""] + numeric_columns, key="source_col_increment_pre_clean")
                             col_kwargs['increment_by'] = st.number_input("Increment By:", value=1, step=1, key="increment_by_pre_clean")
                         else:
                             st.warning("No numeric columns available for increment operation.")
@@ -2054,7 +2633,7 @@ def render_data_cleaning_tool(processor: DataProcessor, artifact_manager: Artifa
                 for i, df in enumerate(processor.dataframes):
                     if df is not None:
                         with st.expander(f"📄 {processor.file_names[i]} ({len(df):,} rows, {len(df.columns)} columns)"):
-                            st.dataframe(df.head(10), use_container_width=True)
+                            st.dataframe(head_preview(df, 10), use_container_width=True)
             
             # Configuration saving section
             with st.expander("Save Configuration", expanded=False):
@@ -2179,77 +2758,79 @@ def render_data_cleaning_tool(processor: DataProcessor, artifact_manager: Artifa
             if processor.cleaned_df is not None:
                 st.markdown("### Cleaned Data Results")
                 
+                n_rows, n_columns, memory_mb = frame_stats(processor.cleaned_df)
                 col1, col2, col3 = st.columns(3)
                 with col1:
-                    st.metric("Rows", f"{len(processor.cleaned_df):,}")
+                    st.metric("Rows", f"{n_rows:,}")
                 with col2:
-                    st.metric("Columns", len(processor.cleaned_df.columns))
+                    st.metric("Columns", n_columns)
                 with col3:
-                    memory_mb = processor.cleaned_df.memory_usage(deep=True).sum() / 1024 / 1024
                     st.metric("Memory", f"{memory_mb:.2f} MB")
                 
                 # Preview cleaned data
-                st.dataframe(processor.cleaned_df.head(20), use_container_width=True)
-                
-                # Save as artifact
-                st.markdown("### Save & Download")
-                
-                col1, col2 = st.columns([2, 1])
-                
-                with col1:
-                    artifact_name = st.text_input(
-                        "Artifact name (to reuse in CSV Merger):",
-                        value=f"cleaned_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-                        help="Give this cleaned dataset a name to use it in the CSV Merger tool"
-                    )
-                
-                with col2:
-                    if st.button("Save as Artifact", type="primary", use_container_width=True):
-                        if artifact_name.strip():
-                            # Use the cleaned dataframe which already has column selection applied
-                            artifact = DataArtifact(
-                                name=artifact_name.strip(),
-                                dataframe=processor.cleaned_df.copy(),  # Ensure we copy the cleaned data
-                                source="cleaning"
-                            )
-                            if artifact_manager.save_artifact(artifact):
-                                st.success(f"✅ Saved as artifact: {artifact_name} with {len(processor.cleaned_df.columns)} columns")
-                                st.rerun()
-                        else:
-                            st.error("Please enter an artifact name")
-                
-                # Download options
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    csv_data = convert_df_to_csv(processor.cleaned_df)
-                    st.download_button(
-                        "▼ Download CSV",
-                        data=csv_data,
-                        file_name="cleaned_data.csv",
-                        mime="text/csv",
-                        use_container_width=True
-                    )
+                render_paginated(processor.cleaned_df, key="cleaned_preview_page")
                 
-                with col2:
-                    excel_data = convert_df_to_excel(processor.cleaned_df)
-                    st.download_button(
-                        "▼ Download Excel",
-                        data=excel_data,
-                        file_name="cleaned_data.xlsx",
-                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                        use_container_width=True
-                    )
-                
-                with col3:
-                    json_data = processor.cleaned_df.to_json(orient='records', indent=2)
-                    st.download_button(
-                        "▼ Download JSON",
-                        data=json_data,
-                        file_name="cleaned_data.json",
-                        mime="application/json",
-                        use_container_width=True
-                    )
+                # Fragment: typing an artifact name reruns only this block, not the cleaning UI above
+                @st.fragment
+                def cleaned_save_and_download():
+                    # Save as artifact
+                    st.markdown("### Save & Download")
+                    
+                    col1, col2 = st.columns([2, 1])
+                    
+                    with col1:
+                        artifact_name = st.text_input(
+                            "Artifact name (to reuse in CSV Merger):",
+                            value=f"cleaned_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                            help="Give this cleaned dataset a name to use it in the CSV Merger tool"
+                        )
+                    
+                    with col2:
+                        if st.button("Save as Artifact", type="primary", use_container_width=True):
+                            if artifact_name.strip():
+                                # Use the cleaned dataframe which already has column selection applied
+                                artifact = DataArtifact(
+                                    name=artifact_name.strip(),
+                                    dataframe=processor.cleaned_df.copy(deep=False),  # Ensure we copy the cleaned data
+                                    source="cleaning"
+                                )
+                                if artifact_manager.save_artifact(artifact):
+                                    st.success(f"✅ Saved as artifact: {artifact_name} with {len(processor.cleaned_df.columns)} columns")
+                                    st.rerun()
+                            else:
+                                st.error("Please enter an artifact name")
+                    
+                    # Download options
+                    col1, col2, col3 = st.columns(3)
+                    
+                    with col1:
+                        st.download_button(
+                            "▼ Download CSV",
+                            data=partial(convert_df_to_csv, processor.cleaned_df),
+                            file_name="cleaned_data.csv",
+                            mime="text/csv",
+                            use_container_width=True
+                        )
+                    
+                    with col2:
+                        st.download_button(
+                            "▼ Download Excel",
+                            data=partial(convert_df_to_excel, processor.cleaned_df),
+                            file_name="cleaned_data.xlsx",
+                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                            use_container_width=True
+                        )
+                    
+                    with col3:
+                        st.download_button(
+                            "▼ Download JSON",
+                            data=partial(convert_df_to_json, processor.cleaned_df),
+                            file_name="cleaned_data.json",
+                            mime="application/json",
+                            use_container_width=True
+                        )
+
+                cleaned_save_and_download()
 
 
 def render_automated_cleaning_tool(processor: DataProcessor, artifact_manager: ArtifactManager):
@@ -2330,7 +2911,7 @@ def render_automated_cleaning_tool(processor: DataProcessor, artifact_manager: A
                         for artifact_name in selected_artifacts:
                             artifact = artifact_manager.get_artifact(artifact_name)
                             if artifact:
-                                processor.dataframes.append(artifact.dataframe.copy())
+                                processor.dataframes.append(artifact.dataframe.copy(deep=False))
                                 processor.file_names.append(f"Artifact: {artifact_name}")
                         
                         if processor.dataframes:
@@ -2371,7 +2952,7 @@ def render_automated_cleaning_tool(processor: DataProcessor, artifact_manager: A
                     for i, df in enumerate(processor.dataframes):
                         if df is not None:
                             with st.expander(f"📄 {processor.file_names[i]} ({len(df):,} rows, {len(df.columns)} columns)"):
-                                st.dataframe(df.head(5), use_container_width=True)
+                                st.dataframe(head_preview(df, 5), use_container_width=True)
                 
                 # Configuration compatibility check
                 config_columns = config.config.get('columns_to_keep', [])
@@ -2400,75 +2981,77 @@ def render_automated_cleaning_tool(processor: DataProcessor, artifact_manager: A
                 if processor.cleaned_df is not None:
                     st.markdown("### Automated Cleaning Results")
                     
+                    n_rows, n_columns, memory_mb = frame_stats(processor.cleaned_df)
                     col1, col2, col3 = st.columns(3)
                     with col1:
-                        st.metric("Rows", f"{len(processor.cleaned_df):,}")
+                        st.metric("Rows", f"{n_rows:,}")
                     with col2:
-                        st.metric("Columns", len(processor.cleaned_df.columns))
+                        st.metric("Columns", n_columns)
                     with col3:
-                        memory_mb = processor.cleaned_df.memory_usage(deep=True).sum() / 1024 / 1024
                         st.metric("Memory", f"{memory_mb:.2f} MB")
                     
-                    st.dataframe(processor.cleaned_df.head(20), use_container_width=True)
-                    
-                    # Save and download options
-                    st.markdown("### Save & Download")
-                    
-                    col1, col2 = st.columns([2, 1])
+                    render_paginated(processor.cleaned_df, key="auto_cleaned_preview_page")
                     
-                    with col1:
-                        auto_artifact_name = st.text_input(
-                            "Save as artifact:",
-                            value=f"auto_cleaned_{selected_config_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-                            help="Save the automatically cleaned data as an artifact"
-                        )
-                    
-                    with col2:
-                        if st.button("Save as Artifact", type="primary", use_container_width=True, key="auto_save_artifact"):
-                            if auto_artifact_name.strip():
-                                artifact = DataArtifact(
-                                    name=auto_artifact_name.strip(),
-                                    dataframe=processor.cleaned_df.copy(),
-                                    source="automated_cleaning"
-                                )
-                                if artifact_manager.save_artifact(artifact):
-                                    st.success(f"✅ Saved as artifact: {auto_artifact_name}")
-                                    st.rerun()
-                            else:
-                                st.error("Please enter an artifact name")
-                    
-                    # Download options
-                    col1, col2, col3 = st.columns(3)
-                    
-                    with col1:
-                        csv_data = convert_df_to_csv(processor.cleaned_df)
-                        st.download_button(
-                            "▼ Download CSV",
-                            data=csv_data,
-                            file_name=f"auto_cleaned_{selected_config_name}.csv",
-                            mime="text/csv",
-                            use_container_width=True
-                        )
-                    
-                    with col2:
-                        excel_data = convert_df_to_excel(processor.cleaned_df)
-                        st.download_button(
-                            "▼ Download Excel",
-                            data=excel_data,
-                            file_name=f"auto_cleaned_{selected_config_name}.xlsx",
-                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                            use_container_width=True
-                        )
-                    
-                    with col3:
-                        json_data = processor.cleaned_df.to_json(orient='records', indent=2)
-                        st.download_button(
-                            "▼ Download JSON",
-                            data=json_data,
-                            file_name=f"auto_cleaned_{selected_config_name}.json",
-                            mime="application/json",
-                            use_container_width=True
-                        )
+                    # Fragment: typing an artifact name reruns only this block, not the cleaning UI above
+                    @st.fragment
+                    def auto_cleaned_save_and_download():
+                        # Save and download options
+                        st.markdown("### Save & Download")
+                        
+                        col1, col2 = st.columns([2, 1])
+                        
+                        with col1:
+                            auto_artifact_name = st.text_input(
+                                "Save as artifact:",
+                                value=f"auto_cleaned_{selected_config_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                                help="Save the automatically cleaned data as an artifact"
+                            )
+                        
+                        with col2:
+                            if st.button("Save as Artifact", type="primary", use_container_width=True, key="auto_save_artifact"):
+                                if auto_artifact_name.strip():
+                                    artifact = DataArtifact(
+                                        name=auto_artifact_name.strip(),
+                                        dataframe=processor.cleaned_df.copy(deep=False),
+                                        source="automated_cleaning"
+                                    )
+                                    if artifact_manager.save_artifact(artifact):
+                                        st.success(f"✅ Saved as artifact: {auto_artifact_name}")
+                                        st.rerun()
+                                else:
+                                    st.error("Please enter an artifact name")
+                        
+                        # Download options
+                        col1, col2, col3 = st.columns(3)
+                        
+                        with col1:
+                            st.download_button(
+                                "▼ Download CSV",
+                                data=partial(convert_df_to_csv, processor.cleaned_df),
+                                file_name=f"auto_cleaned_{selected_config_name}.csv",
+                                mime="text/csv",
+                                use_container_width=True
+                            )
+                        
+                        with col2:
+                            st.download_button(
+                                "▼ Download Excel",
+                                data=partial(convert_df_to_excel, processor.cleaned_df),
+                                file_name=f"auto_cleaned_{selected_config_name}.xlsx",
+                                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                                use_container_width=True
+                            )
+                        
+                        with col3:
+                            st.download_button(
+                                "▼ Download JSON",
+                                data=partial(convert_df_to_json, processor.cleaned_df),
+                                file_name=f"auto_cleaned_{selected_config_name}.json",
+                                mime="application/json",
+                                use_container_width=True
+                            )
+
+                    auto_cleaned_save_and_download()
 
 def render_csv_merger_tool(processor: DataProcessor, artifact_manager: ArtifactManager):
     """Render the CSV merger interface"""
@@ -2476,6 +3059,7 @@ def render_csv_merger_tool(processor: DataProcessor, artifact_manager: ArtifactM
     
     # Data source selection
     st.markdown("### Select Data Sources")
+    artifacts = artifact_manager.list_artifacts()  # shared by both "Use Artifact" branches
     
     col1, col2 = st.columns(2)
     
@@ -2492,10 +3076,9 @@ def render_csv_merger_tool(processor: DataProcessor, artifact_manager: ArtifactM
         if left_source == "Upload File":
             left_file = st.file_uploader("Choose LEFT CSV file", type=['csv'], key="merger_left")
             if left_file:
-                if processor.load_files([left_file]):
+                if processor.load_file_at(0, left_file):
                     st.success(f"✅ Loaded: {left_file.name}")
         elif left_source == "Use Artifact":
-            artifacts = artifact_manager.list_artifacts()
             if artifacts:
                 left_artifact = st.selectbox("Select left artifact:", [""] + artifacts, key="left_artifact")
                 if left_artifact:
@@ -2531,23 +3114,9 @@ def render_csv_merger_tool(processor: DataProcessor, artifact_manager: ArtifactM
         if right_source == "Upload File":
             right_file = st.file_uploader("Choose RIGHT CSV file", type=['csv'], key="merger_right")
             if right_file:
-                # Ensure we have space for the right file
-                if len(processor.dataframes) < 2:
-                    processor.dataframes.append(None)
-                    processor.file_names.append("")
-                
-                try:
-                    df = pd.read_csv(right_file, encoding='utf-8')
-                except UnicodeDecodeError:
-                    right_file.seek(0)
-                    df = pd.read_csv(right_file, encoding='latin1')
-                
-                df.columns = df.columns.str.strip()
-                processor.dataframes[1] = df
-                processor.file_names[1] = right_file.name
-                st.success(f"✅ Loaded: {right_file.name}")
+                if processor.load_file_at(1, right_file):
+                    st.success(f"✅ Loaded: {right_file.name}")
         elif right_source == "Use Artifact":
-            artifacts = artifact_manager.list_artifacts()
             if artifacts:
                 right_artifact = st.selectbox("Select right artifact:", [""] + artifacts, key="right_artifact")
                 if right_artifact:
@@ -2581,12 +3150,12 @@ def render_csv_merger_tool(processor: DataProcessor, artifact_manager: ArtifactM
         
         with col1:
             st.markdown("**Left Dataset Preview**")
-            st.dataframe(processor.dataframes[0].head(5), use_container_width=True)
+            st.dataframe(head_preview(processor.dataframes[0], 5), use_container_width=True)
             st.caption(f"{len(processor.dataframes[0]):,} rows, {len(processor.dataframes[0].columns)} columns")
         
         with col2:
             st.markdown("**Right Dataset Preview**")
-            st.dataframe(processor.dataframes[1].head(5), use_container_width=True)
+            st.dataframe(head_preview(processor.dataframes[1], 5), use_container_width=True)
             st.caption(f"{len(processor.dataframes[1]):,} rows, {len(processor.dataframes[1].columns)} columns")
         
         # Key selection
@@ -2632,17 +3201,28 @@ def render_csv_merger_tool(processor: DataProcessor, artifact_manager: ArtifactM
             }[x]
         )
         
+        # Column pre-filter
+        with st.expander("Columns to Include", expanded=False):
+            st.info("Deselect columns you don't need in the result. The join keys are always kept.")
+            col1, col2 = st.columns(2)
+            with col1:
+                left_columns = st.multiselect("Columns from left", left_cols, default=left_cols, key="left_columns_select")
+            with col2:
+                right_columns = st.multiselect("Columns from right", right_cols, default=right_cols, key="right_columns_select")
+        
         # Perform merge
         if st.button("Perform Merge", type="primary", use_container_width=True):
             if left_key and right_key:
-                if processor.merge_dataframes(0, 1, left_key, right_key, join_type):
+                if processor.merge_dataframes(0, 1, left_key, right_key, join_type,
+                                              left_columns=left_columns, right_columns=right_columns):
                     st.success("✅ Merge completed successfully!")
                     st.rerun()
             else:
                 st.error("Please select join keys for both datasets")
         
-        # Show merge results
-        if processor.merged_df is not None:
+        # Show merge results (bound once so every widget below uses the same frame)
+        merged_df = processor.merged_df
+        if merged_df is not None:
             st.markdown("### Merge Results")
             
             col1, col2, col3 = st.columns(3)
@@ -2651,68 +3231,79 @@ def render_csv_merger_tool(processor: DataProcessor, artifact_manager: ArtifactM
             with col2:
                 st.metric("Right Records", f"{len(processor.dataframes[1]):,}")
             with col3:
-                st.metric("Result Records", f"{len(processor.merged_df):,}")
-            
-            st.dataframe(processor.merged_df.head(20), use_container_width=True)
+                st.metric("Result Records", f"{len(merged_df):,}")
             
-            # Save merged result as artifact
-            st.markdown("### Save & Download")
-            
-            col1, col2 = st.columns([2, 1])
-            
-            with col1:
-                merge_artifact_name = st.text_input(
-                    "Save merged result as artifact:",
-                    value=f"merged_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-                    help="Save this merged dataset to reuse later"
-                )
+            render_paginated(merged_df, key="merged_preview_page")
             
-            with col2:
-                if st.button("Save Merge Result", type="primary", use_container_width=True):
-                    if merge_artifact_name.strip():
-                        artifact = DataArtifact(
-                            name=merge_artifact_name.strip(),
-                            dataframe=processor.merged_df,
-                            source="merging"
-                        )
-                        if artifact_manager.save_artifact(artifact):
-                            st.success(f"✅ Saved as artifact: {merge_artifact_name}")
-                            st.rerun()
-                    else:
-                        st.error("Please enter an artifact name")
-            
-            # Download merged data
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                csv_data = convert_df_to_csv(processor.merged_df)
-                st.download_button(
-                    "▼ Download CSV",
-                    data=csv_data,
-                    file_name="merged_data.csv",
-                    mime="text/csv",
-                    use_container_width=True
-                )
-            
-            with col2:
-                excel_data = convert_df_to_excel(processor.merged_df)
-                st.download_button(
-                    "▼ Download Excel",
-                    data=excel_data,
-                    file_name="merged_data.xlsx",
-                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                    use_container_width=True
-                )
-            
-            with col3:
-                json_data = processor.merged_df.to_json(orient='records', indent=2)
-                st.download_button(
-                    "▼ Download JSON",
-                    data=json_data,
-                    file_name="merged_data.json",
-                    mime="application/json",
-                    use_container_width=True
-                )
+            # Fragment: typing an artifact name reruns only this block, not the merge UI above
+            @st.fragment
+            def merged_save_and_download():
+                # Save merged result as artifact
+                st.markdown("### Save & Download")
+                
+                col1, col2 = st.columns([2, 1])
+                
+                with col1:
+                    merge_artifact_name = st.text_input(
+                        "Save merged result as artifact:",
+                        value=f"merged_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                        help="Save this merged dataset to reuse later"
+                    )
+                
+                with col2:
+                    if st.button("Save Merge Result", type="primary", use_container_width=True):
+                        if merge_artifact_name.strip():
+                            artifact = DataArtifact(
+                                name=merge_artifact_name.strip(),
+                                dataframe=merged_df,
+                                source="merging"
+                            )
+                            if artifact_manager.save_artifact(artifact):
+                                st.success(f"✅ Saved as artifact: {merge_artifact_name}")
+                                st.rerun()
+                        else:
+                            st.error("Please enter an artifact name")
+                
+                # Download merged data (payloads are built only when a button is clicked)
+                col1, col2, col3, col4 = st.columns(4)
+                
+                with col1:
+                    st.download_button(
+                        "▼ Download CSV (gzip)",
+                        data=partial(convert_df_to_csv_gz, merged_df),
+                        file_name="merged_data.csv.gz",
+                        mime="application/gzip",
+                        use_container_width=True
+                    )
+                
+                with col2:
+                    st.download_button(
+                        "▼ Download Excel",
+                        data=partial(convert_df_to_excel, merged_df),
+                        file_name="merged_data.xlsx",
+                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                        use_container_width=True
+                    )
+                
+                with col3:
+                    st.download_button(
+                        "▼ Download JSON",
+                        data=partial(convert_df_to_json, merged_df),
+                        file_name="merged_data.json",
+                        mime="application/json",
+                        use_container_width=True
+                    )
+                
+                with col4:
+                    st.download_button(
+                        "▼ Download Parquet",
+                        data=partial(convert_df_to_parquet, merged_df),
+                        file_name="merged_data.parquet",
+                        mime="application/octet-stream",
+                        use_container_width=True
+                    )
+
+            merged_save_and_download()
     else:
         st.info("Please select both left and right datasets to proceed with merging")
 
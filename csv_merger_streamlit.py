@@ -1,9 +1,20 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
+import pyarrow as pa
 import io
+import os
+import hashlib
 from typing import List, Tuple, Optional, Dict, Any
 import difflib
+from functools import partial
+
+from csv_parsing import downcast_integers, read_csv_table
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    fuzz = process = None
 
 # Page configuration
 st.set_page_config(
@@ -66,6 +77,93 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+def _read_csv_arrow(raw: bytes) -> Optional[pd.DataFrame]:
+    """Parse CSV bytes with Arrow's multithreaded reader; None if pandas should handle the file"""
+    table = read_csv_table(raw)
+    if table is None:
+        return None
+    # Default conversion gives text the same dtype pd.read_csv does, so both readers agree
+    return table.to_pandas(self_destruct=True)
+
+def _read_csv_pandas(raw: bytes, chunk_threshold: int = 50 << 20) -> pd.DataFrame:
+    """Parse with pandas; very large files are read in chunks and concatenated once"""
+    if len(raw) <= chunk_threshold:
+        return pd.read_csv(io.BytesIO(raw))
+    chunks = list(pd.read_csv(io.BytesIO(raw), chunksize=500_000))
+    return pd.concat(chunks, ignore_index=True)
+
+# Parsed copies of larger uploads, shared across sessions and restarts. They live in the user's own
+# cache directory rather than the shared temp dir, created owner-only so other local users can't read them
+PARQUET_CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+                                 'csv_merger')
+PARQUET_CACHE_ENTRIES = 8
+PARQUET_CACHE_BYTES = 512 << 20
+
+def _get_parquet_cache_dir() -> str:
+    """Cache directory, created on first use and kept readable by its owner only"""
+    os.makedirs(PARQUET_CACHE_DIR, mode=0o700, exist_ok=True)
+    # makedirs leaves an existing directory's mode alone (and the umask applies to new ones)
+    os.chmod(PARQUET_CACHE_DIR, 0o700)
+    return PARQUET_CACHE_DIR
+
+def _read_parquet_cache(path: str) -> Optional[pd.DataFrame]:
+    """Cached frame for path, or None on a miss or an unreadable entry"""
+    try:
+        df = pd.read_parquet(path, engine='pyarrow')
+    except (OSError, pa.ArrowException):
+        return None
+    os.utime(path)  # mark as recently used for eviction
+    return df
+
+def _write_parquet_cache(df: pd.DataFrame, path: str):
+    """Store df at path and evict the least recently used entries; failures only skip caching"""
+    try:
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        df.to_parquet(tmp_path, engine='pyarrow', compression='zstd', index=False)
+        os.replace(tmp_path, path)
+        
+        # Keep the most recently used entries within both the entry and the byte budget
+        entries = [entry for entry in os.scandir(os.path.dirname(path)) if entry.name.endswith('.parquet')]
+        entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        total_bytes = 0
+        for count, entry in enumerate(entries, start=1):
+            total_bytes += entry.stat().st_size
+            if count > PARQUET_CACHE_ENTRIES or total_bytes > PARQUET_CACHE_BYTES:
+                os.remove(entry.path)
+    except (OSError, ValueError, pa.ArrowException):
+        # e.g. mixed-type or non-string column labels, which Parquet can't store
+        pass
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def parse_csv(raw: bytes, use_arrow: bool = True) -> pd.DataFrame:
+    """Parse an uploaded CSV once per distinct file content; reruns reuse the parsed frame"""
+    cache_path = None
+    if len(raw) > 1 << 20:
+        digest = hashlib.sha256(raw).hexdigest()
+        reader = 'arrow' if use_arrow else 'pandas'
+        try:
+            cache_path = os.path.join(_get_parquet_cache_dir(), f"{digest}-{reader}.parquet")
+        except OSError:
+            pass  # no writable cache directory: parse without the disk cache
+        else:
+            df = _read_parquet_cache(cache_path)
+            if df is not None:
+                return df
+    
+    df = None
+    if use_arrow and len(raw) > 1 << 20:
+        df = _read_csv_arrow(raw)
+    if df is None:
+        df = _read_csv_pandas(raw)
+    df = downcast_integers(df)
+    
+    if cache_path is not None:
+        _write_parquet_cache(df, cache_path)
+    return df
+
+# Column names preferred as join keys when both files have them
+PRIORITY_KEYS = ('id', 'ID', 'key', 'Key', 'code', 'Code', 'name', 'Name')
+
 class CSVMerger:
     """Main class for handling CSV merge operations"""
     
@@ -73,12 +171,14 @@ class CSVMerger:
         self.left_df: Optional[pd.DataFrame] = None
         self.right_df: Optional[pd.DataFrame] = None
         self.merged_df: Optional[pd.DataFrame] = None
+        # side -> (frame, its column names); rebuilt only when that side's frame is replaced
+        self._column_names: Dict[str, Tuple[pd.DataFrame, List[str]]] = {}
         
-    def load_csv(self, uploaded_file, file_side: str) -> bool:
+    def load_csv(self, uploaded_file, file_side: str, use_arrow: bool = True) -> bool:
         """Load CSV file and return success status"""
         try:
             if uploaded_file is not None:
-                df = pd.read_csv(uploaded_file)
+                df = parse_csv(uploaded_file.getvalue(), use_arrow)
                 if file_side == "left":
                     self.left_df = df
                 else:
@@ -90,38 +190,69 @@ class CSVMerger:
         return False
     
     def get_column_names(self, side: str) -> List[str]:
-        """Get column names for specified side"""
-        df = self.left_df if side == "left" else self.right_df
-        return list(df.columns) if df is not None else []
+        """Get column names for specified side ("left", "right" or "merged")"""
+        if side == "left":
+            df = self.left_df
+        elif side == "merged":
+            df = self.merged_df
+        else:
+            df = self.right_df
+        if df is None:
+            return []
+        
+        cached = self._column_names.get(side)
+        if cached is None or cached[0] is not df:
+            cached = (df, list(df.columns))
+            self._column_names[side] = cached
+        return cached[1]
     
     def auto_detect_keys(self) -> Tuple[Optional[str], Optional[str]]:
         """Automatically detect the best matching key columns"""
         if self.left_df is None or self.right_df is None:
             return None, None
             
-        left_cols = set(self.left_df.columns)
-        right_cols = set(self.right_df.columns)
-        
-        # Find exact matches
-        exact_matches = left_cols.intersection(right_cols)
+        # Shared names, in left-file column order, via the Index's own hash tables
+        exact_matches = self.left_df.columns.intersection(self.right_df.columns, sort=False)
         
-        if exact_matches:
+        if len(exact_matches):
             # Prioritize common key names
-            priority_keys = ['id', 'ID', 'key', 'Key', 'code', 'Code', 'name', 'Name']
-            for key in priority_keys:
+            for key in PRIORITY_KEYS:
                 if key in exact_matches:
                     return key, key
-            # Return first exact match
-            best_match = list(exact_matches)[0]
-            return best_match, best_match
+            # Otherwise the first exact match
+            return exact_matches[0], exact_matches[0]
+        
+        left_cols = self.get_column_names("left")
+        right_cols = self.get_column_names("right")
         
         # Look for similar column names using fuzzy matching
+        if process is not None and left_cols and right_cols:
+            # Score every pair at once in C instead of one SequenceMatcher per pair
+            scores = process.cdist([col.lower() for col in left_cols], [col.lower() for col in right_cols],
+                                   scorer=fuzz.ratio, workers=-1)
+            i, j = np.unravel_index(scores.argmax(), scores.shape)
+            if scores[i, j] / 100.0 > 0.6:
+                return left_cols[i], right_cols[j]
+            return None, None
+        
         best_match = None
         best_ratio = 0.6  # Minimum similarity threshold
+        left_names = [(col, col.lower()) for col in left_cols]
         
-        for left_col in left_cols:
-            for right_col in right_cols:
-                ratio = difflib.SequenceMatcher(None, left_col.lower(), right_col.lower()).ratio()
+        # One matcher per right name; pairs that cannot beat the current best are rejected
+        # by cheap upper bounds before the full ratio() is computed
+        matcher = difflib.SequenceMatcher()
+        for right_col in right_cols:
+            right_name = right_col.lower()
+            matcher.set_seq2(right_name)
+            for left_col, left_name in left_names:
+                total_len = len(left_name) + len(right_name)
+                if not total_len or 2 * min(len(left_name), len(right_name)) / total_len <= best_ratio:
+                    continue
+                matcher.set_seq1(left_name)
+                if matcher.quick_ratio() <= best_ratio:
+                    continue
+                ratio = matcher.ratio()
                 if ratio > best_ratio:
                     best_ratio = ratio
                     best_match = (left_col, right_col)
@@ -139,27 +270,23 @@ class CSVMerger:
             return False
         
         try:
-            left_df = self.left_df.copy()
-            right_df = self.right_df.copy()
-            
-            # Rename right key to match left key for joining if they're different
-            if left_key != right_key:
-                right_df = right_df.rename(columns={right_key: left_key})
+            # merge, reindex and concat never mutate their inputs, so no defensive copies
+            left_df = self.left_df
+            right_df = self.right_df
             
-            if join_type == "inner":
-                self.merged_df = pd.merge(left_df, right_df, on=left_key, how='inner', suffixes=('_left', '_right'))
-            elif join_type == "left":
-                self.merged_df = pd.merge(left_df, right_df, on=left_key, how='left', suffixes=('_left', '_right'))
-            elif join_type == "right":
-                self.merged_df = pd.merge(left_df, right_df, on=left_key, how='right', suffixes=('_left', '_right'))
-            elif join_type == "outer":
-                self.merged_df = pd.merge(left_df, right_df, on=left_key, how='outer', suffixes=('_left', '_right'))
+            if join_type in ("inner", "left", "right", "outer"):
+                self.merged_df = self._merge_keys(left_df, right_df, left_key, right_key, join_type)
             elif join_type == "union":
-                # For union, we need to align columns first
-                all_cols = list(set(left_df.columns) | set(right_df.columns))
-                left_aligned = left_df.reindex(columns=all_cols, fill_value='')
-                right_aligned = right_df.reindex(columns=all_cols, fill_value='')
-                self.merged_df = pd.concat([left_aligned, right_aligned], ignore_index=True)
+                # Rename right key to match left key so the key columns line up
+                if left_key != right_key:
+                    right_df = right_df.rename(columns={right_key: left_key})
+                self.merged_df = self._union_frames(left_df, right_df)
+                # Blank out only the text columns that one side lacks
+                one_sided = left_df.columns.symmetric_difference(right_df.columns)
+                text_cols = self.merged_df.select_dtypes(include=['object', 'string']).columns
+                fill_cols = [col for col in one_sided if col in text_cols]
+                if fill_cols:
+                    self.merged_df[fill_cols] = self.merged_df[fill_cols].fillna('')
             
             return True
             
@@ -167,6 +294,32 @@ class CSVMerger:
             st.error(f"Join operation failed: {str(e)}")
             return False
     
+    def _union_frames(self, left_df: pd.DataFrame, right_df: pd.DataFrame) -> pd.DataFrame:
+        """Stack two frames, aligning their columns by name; missing cells become nulls"""
+        try:
+            # Arrow aligns the schemas and concatenates the column buffers in C++
+            tables = [pa.Table.from_pandas(df, preserve_index=False) for df in (left_df, right_df)]
+            combined = pa.concat_tables(tables, promote_options='default')
+        except (pa.ArrowException, ValueError):
+            # Mixed-type object columns or conflicting column types: let pandas upcast
+            return pd.concat([left_df, right_df], ignore_index=True, join='outer')
+        string_types = {pa.string(): pd.StringDtype('pyarrow'), pa.large_string(): pd.StringDtype('pyarrow')}
+        return combined.to_pandas(types_mapper=string_types.get, self_destruct=True)
+    
+    def _merge_keys(self, left_df: pd.DataFrame, right_df: pd.DataFrame, left_key: str, right_key: str,
+                    how: str) -> pd.DataFrame:
+        """Merge on the key columns, matching differently named keys without renaming the right frame"""
+        # Inner and left joins only keep left key values, so the right key can be matched under
+        # its own name and dropped afterwards instead of renaming the right frame first
+        if (left_key != right_key and how in ("inner", "left") and
+                right_key not in left_df.columns and left_key not in right_df.columns):
+            return pd.merge(left_df, right_df, left_on=left_key, right_on=right_key, how=how,
+                            suffixes=('_left', '_right')).drop(columns=right_key)
+        if left_key != right_key:
+            # Right and outer joins need one shared key column holding both sides' values
+            right_df = right_df.rename(columns={right_key: left_key})
+        return pd.merge(left_df, right_df, on=left_key, how=how, suffixes=('_left', '_right'))
+    
     def get_join_stats(self) -> Dict[str, int]:
         """Get statistics about the join operation"""
         stats = {
@@ -177,6 +330,26 @@ class CSVMerger:
         }
         return stats
 
+@st.cache_data(max_entries=4, show_spinner=False)
+def to_csv_bytes(df: pd.DataFrame, columns: Tuple[str, ...]) -> bytes:
+    """CSV download payload, written straight to bytes and cached across reruns"""
+    output = io.BytesIO()
+    df.to_csv(output, columns=list(columns), index=False)
+    return output.getvalue()
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def to_json_bytes(df: pd.DataFrame, columns: Tuple[str, ...]) -> bytes:
+    """JSON records download payload, cached across reruns"""
+    return df[list(columns)].to_json(orient='records', indent=2).encode('utf-8')
+
+@st.cache_data(max_entries=4, show_spinner="Building Excel file...")
+def to_excel_bytes(df: pd.DataFrame, columns: Tuple[str, ...]) -> bytes:
+    """Excel download payload, written with xlsxwriter and cached across reruns"""
+    output = io.BytesIO()
+    with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
+        df.to_excel(writer, sheet_name='Merged Data', columns=list(columns), index=False)
+    return output.getvalue()
+
 def create_venn_diagram():
     """Create a text-based Venn diagram representation"""
     st.markdown("""
@@ -197,6 +370,115 @@ def create_venn_diagram():
     </div>
     """, unsafe_allow_html=True)
 
+@st.fragment
+def show_results(merger: CSVMerger):
+    """Merge results, column picker and downloads; widget changes here rerun only this fragment"""
+    st.header("📊 Merge Results")
+    
+    # Statistics
+    stats = merger.get_join_stats()
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Left Records", stats["left_records"])
+    
+    with col2:
+        st.metric("Right Records", stats["right_records"])
+    
+    with col3:
+        st.metric("Result Records", stats["result_records"])
+    
+    with col4:
+        st.metric("Result Columns", stats["result_columns"])
+    
+    # Column selection
+    st.subheader("📋 Select Columns to Display")
+    
+    all_columns = merger.get_column_names("merged")
+    
+    col1, col2, col3 = st.columns([1, 1, 2])
+    
+    with col1:
+        if st.button("Select All"):
+            st.session_state.selected_columns = all_columns
+    
+    with col2:
+        if st.button("Deselect All"):
+            st.session_state.selected_columns = []
+    
+    # Initialize selected columns if not exists
+    if 'selected_columns' not in st.session_state:
+        st.session_state.selected_columns = all_columns
+    
+    selected_columns = st.multiselect(
+        "Choose columns:",
+        options=all_columns,
+        default=st.session_state.selected_columns,
+        key="column_selector"
+    )
+    
+    # Update session state
+    st.session_state.selected_columns = selected_columns
+    
+    # Display filtered results
+    if selected_columns:
+        st.subheader("🔍 Results Preview")
+        merged_df = merger.merged_df
+        # Downloads project the columns themselves, so the full filtered frame is never built here
+        export_columns = tuple(selected_columns)
+        
+        # Show one page at a time; only that slice is serialized to the browser
+        page_size = 50
+        pages = max(1, -(-len(merged_df) // page_size))
+        page = 1
+        if pages > 1:
+            page = st.number_input(f"Page (of {pages:,})", min_value=1, max_value=pages, value=1, step=1,
+                                   key="results_page")
+        start = (page - 1) * page_size
+        preview_df = merged_df.iloc[start:start + page_size][selected_columns]
+        st.dataframe(preview_df, use_container_width=True, hide_index=True)
+        st.caption(f"Total rows: {len(merged_df):,}")
+        
+        # Download button
+        st.subheader("💾 Download Results")
+        
+        # Payloads are built only when a button is clicked
+        st.download_button(
+            label="📥 Download Merged CSV",
+            data=partial(to_csv_bytes, merged_df, export_columns),
+            file_name="merged_data.csv",
+            mime="text/csv",
+            type="primary",
+            use_container_width=True
+        )
+        
+        # Additional download options
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Excel download
+            st.download_button(
+                label="📊 Download as Excel",
+                data=partial(to_excel_bytes, merged_df, export_columns),
+                file_name="merged_data.xlsx",
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                use_container_width=True
+            )
+        
+        with col2:
+            # JSON download
+            st.download_button(
+                label="🔄 Download as JSON",
+                data=partial(to_json_bytes, merged_df, export_columns),
+                file_name="merged_data.json",
+                mime="application/json",
+                use_container_width=True
+            )
+    
+    else:
+        st.warning("Please select at least one column to display results.")
+
 def main():
     # Header
     st.markdown("""
@@ -231,9 +513,15 @@ def main():
             key="right_file"
         )
         
+        use_arrow = st.toggle(
+            "Fast CSV reader (PyArrow)",
+            value=True,
+            help="Parse files over 1 MB with the multithreaded PyArrow reader"
+        )
+        
         # Load files
-        left_loaded = merger.load_csv(left_file, "left")
-        right_loaded = merger.load_csv(right_file, "right")
+        left_loaded = merger.load_csv(left_file, "left", use_arrow)
+        right_loaded = merger.load_csv(right_file, "right", use_arrow)
         
         # Show file info
         if left_loaded and merger.left_df is not None:
@@ -374,115 +662,7 @@ def main():
         
         # Results section
         if merger.merged_df is not None:
-            st.header("📊 Merge Results")
-            
-            # Statistics
-            stats = merger.get_join_stats()
-            
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.metric("Left Records", stats["left_records"])
-            
-            with col2:
-                st.metric("Right Records", stats["right_records"])
-            
-            with col3:
-                st.metric("Result Records", stats["result_records"])
-            
-            with col4:
-                st.metric("Result Columns", stats["result_columns"])
-            
-            # Column selection
-            st.subheader("📋 Select Columns to Display")
-            
-            all_columns = list(merger.merged_df.columns)
-            
-            col1, col2, col3 = st.columns([1, 1, 2])
-            
-            with col1:
-                if st.button("Select All"):
-                    st.session_state.selected_columns = all_columns
-            
-            with col2:
-                if st.button("Deselect All"):
-                    st.session_state.selected_columns = []
-            
-            # Initialize selected columns if not exists
-            if 'selected_columns' not in st.session_state:
-                st.session_state.selected_columns = all_columns
-            
-            selected_columns = st.multiselect(
-                "Choose columns:",
-                options=all_columns,
-                default=st.session_state.selected_columns,
-                key="column_selector"
-            )
-            
-            # Update session state
-            st.session_state.selected_columns = selected_columns
-            
-            # Display filtered results
-            if selected_columns:
-                st.subheader("🔍 Results Preview")
-                filtered_df = merger.merged_df[selected_columns]
-                
-                # Show preview (first 1000 rows)
-                preview_df = filtered_df.head(1000)
-                st.dataframe(preview_df, use_container_width=True)
-                
-                if len(filtered_df) > 1000:
-                    st.info(f"Showing first 1000 rows. Total rows: {len(filtered_df)}")
-                
-                # Download button
-                st.subheader("💾 Download Results")
-                
-                # Prepare CSV for download
-                csv_buffer = io.StringIO()
-                filtered_df.to_csv(csv_buffer, index=False)
-                csv_data = csv_buffer.getvalue()
-                
-                st.download_button(
-                    label="📥 Download Merged CSV",
-                    data=csv_data,
-                    file_name="merged_data.csv",
-                    mime="text/csv",
-                    type="primary",
-                    use_container_width=True
-                )
-                
-                # Additional download options
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    # Excel download
-                    excel_buffer = io.BytesIO()
-                    with pd.ExcelWriter(excel_buffer, engine='openpyxl') as writer:
-                        filtered_df.to_excel(writer, sheet_name='Merged Data', index=False)
-                    excel_data = excel_buffer.getvalue()
-                    
-                    st.download_button(
-                        label="📊 Download as Excel",
-                        data=excel_data,
-                        file_name="merged_data.xlsx",
-                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                        use_container_width=True
-                    )
-                
-                with col2:
-                    # JSON download
-                    json_data = filtered_df.to_json(orient='records', indent=2)
-                    
-                    st.download_button(
-                        label="🔄 Download as JSON",
-                        data=json_data,
-                        file_name="merged_data.json",
-                        mime="application/json",
-                        use_container_width=True
-                    )
-            
-            else:
-                st.warning("Please select at least one column to display results.")
+            show_results(merger)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,102 @@
+"""CSV parsing helpers shared by the merger apps, so both read uploads exactly like pd.read_csv"""
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+
+# pandas' default missing-value markers, so the Arrow reader treats the same cells as missing
+NA_VALUES = ['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+             '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null']
+
+def pandas_column_names(names: List[str]) -> List[str]:
+    """Rename blank and repeated headers the way pd.read_csv does ('Unnamed: 3', 'id.1', ...)"""
+    unnamed = [i for i, name in enumerate(names) if not name]
+    names = [name if name else f"Unnamed: {i}" for i, name in enumerate(names)]
+    # Like pandas, mangle named columns first so given names keep priority over unnamed ones
+    unnamed_set = set(unnamed)
+    order = [i for i in range(len(names)) if i not in unnamed_set] + unnamed
+    counts: Dict[str, int] = {}
+    for i in order:
+        name = original = names[i]
+        count = counts.get(name, 0)
+        while count > 0:
+            counts[original] = count + 1
+            name = f"{original}.{count}"
+            count = count + 1 if name in names else counts.get(name, 0)
+        names[i] = name
+        counts[name] = count + 1
+    return names
+
+# pandas only reads these spellings as booleans; Arrow would also take 1/0, turning e.g. 'true,1' into bools
+TRUE_VALUES = ['True', 'TRUE', 'true']
+FALSE_VALUES = ['False', 'FALSE', 'false']
+
+def _convert_options(**kwargs) -> pacsv.ConvertOptions:
+    """Arrow conversion options with pandas' missing-value and boolean markers"""
+    return pacsv.ConvertOptions(null_values=NA_VALUES, true_values=TRUE_VALUES, false_values=FALSE_VALUES,
+                                strings_can_be_null=True, **kwargs)
+
+def _numbers_differ_from_pandas(raw: bytes, table: pa.Table, encoding: str) -> bool:
+    """True if Arrow parsed some numeric column differently from pd.read_csv"""
+    numeric = [field.name for field in table.schema
+               if pa.types.is_integer(field.type) or pa.types.is_floating(field.type)]
+    # Integers outside int64 come back as lossy floats, where pandas returns uint64 or Python ints
+    for name in numeric:
+        column = table.column(name)
+        if pa.types.is_floating(column.type):
+            largest = pc.max(pc.abs(pc.filter(column, pc.is_finite(column)))).as_py()
+            if largest is not None and largest >= 2 ** 63:
+                return True
+    
+    # Arrow's integer parser reads hex ('0x10' -> 16) and turns '+5' into a float, where pandas keeps hex as
+    # text and reads '+5' as an integer; only files containing those characters need their text checked
+    if not numeric or not (b'0x' in raw or b'0X' in raw or b'+' in raw):
+        return False
+    read_options = pacsv.ReadOptions(encoding=encoding, block_size=8 << 20, column_names=table.column_names,
+                                     skip_rows=1)
+    convert_options = _convert_options(include_columns=numeric, column_types={name: pa.string() for name in numeric})
+    text = pacsv.read_csv(pa.BufferReader(raw), read_options=read_options, convert_options=convert_options)
+    return any(pc.any(pc.match_substring_regex(column, r'^\s*(\+|[+-]?0[xX])')).as_py() for column in text.columns)
+
+def read_csv_table(raw: bytes, encoding: str = 'utf8') -> Optional[pa.Table]:
+    """Parse CSV bytes with Arrow's multithreaded reader into the columns pd.read_csv would give;
+    None if the file should be left to pandas"""
+    read_options = pacsv.ReadOptions(encoding=encoding, block_size=8 << 20)
+    try:
+        table = pacsv.read_csv(pa.BufferReader(raw), read_options=read_options, convert_options=_convert_options())
+        names = pandas_column_names(table.column_names)
+        # Arrow infers dates and timestamps where pandas keeps the text, so read those columns again as strings
+        temporal = [name for name, field in zip(names, table.schema) if pa.types.is_temporal(field.type)]
+        if temporal:
+            read_options = pacsv.ReadOptions(encoding=encoding, block_size=8 << 20, column_names=names, skip_rows=1)
+            convert_options = _convert_options(column_types={name: pa.string() for name in temporal})
+            table = pacsv.read_csv(pa.BufferReader(raw), read_options=read_options, convert_options=convert_options)
+        else:
+            table = table.rename_columns(names)
+        if _numbers_differ_from_pandas(raw, table, encoding):
+            return None
+    except pa.ArrowInvalid:
+        return None
+    # Invalid UTF-8 comes back as binary columns, and booleans with gaps convert with None where pandas
+    # has NaN; leave those files to pandas
+    if any(pa.types.is_binary(field.type) or (pa.types.is_boolean(field.type) and table.column(i).null_count)
+           for i, field in enumerate(table.schema)):
+        return None
+    # Columns whose cells are all missing are float64 NaN in pandas, not object None
+    for i, field in enumerate(table.schema):
+        if pa.types.is_null(field.type) and table.num_rows:
+            table = table.set_column(i, field.name, table.column(i).cast(pa.float64()))
+    return table
+
+def downcast_integers(df: pd.DataFrame) -> pd.DataFrame:
+    """Narrow int64 columns to int32 in place where every value fits, halving their memory"""
+    int32 = np.iinfo(np.int32)
+    for i, dtype in enumerate(df.dtypes):
+        if dtype == np.int64 and len(df):
+            values = df.iloc[:, i].to_numpy()
+            if int32.min <= values.min() and values.max() <= int32.max:
+                df.isetitem(i, values.astype(np.int32))
+    return df
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The apps are plain scripts at the repository root rather than an installed package
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir)))
@@ -0,0 +1,41 @@
+import pandas as pd
+import pytest
+
+from app import DataProcessor
+
+
+@pytest.fixture
+def processor():
+    return DataProcessor(artifact_manager=None)
+
+
+def test_inner_join_keeps_left_order_when_left_is_smaller(processor):
+    left = pd.DataFrame({'id': [5, 5, 3, 1], 'left_value': ['a', 'b', 'c', 'd']})
+    right = pd.DataFrame({'id': [1, 2, 3, 4, 5, 6], 'right_value': list('uvwxyz')})
+
+    merged = processor._merge_on_key(left, right, 'id', 'inner')
+
+    assert merged['id'].tolist() == [5, 5, 3, 1]
+    pd.testing.assert_frame_equal(merged, pd.merge(left, right, on='id', how='inner', suffixes=('_left', '_right')))
+
+
+@pytest.mark.parametrize('how', ['left', 'right'])
+def test_swapped_outer_side_joins_match_pandas(processor, how):
+    left = pd.DataFrame({'id': [5, 5, 3, 7], 'value': [1, 2, 3, 4]})
+    right = pd.DataFrame({'id': [6, 5, 3, 3, 1, 2], 'value': [10, 20, 30, 40, 50, 60]})
+
+    merged = processor._merge_on_key(left, right, 'id', how)
+
+    expected = pd.merge(left, right, on='id', how=how, suffixes=('_left', '_right'))
+    pd.testing.assert_frame_equal(merged, expected)
+
+
+def test_merge_dataframes_inner_join_keeps_left_order(processor):
+    processor.dataframes = [
+        pd.DataFrame({'id': [5, 5, 3, 1], 'name': ['e1', 'e2', 'c', 'a']}),
+        pd.DataFrame({'id': [1, 2, 3, 4, 5], 'score': [10, 20, 30, 40, 50]}),
+    ]
+
+    assert processor.merge_dataframes(0, 1, 'id', 'id', 'inner')
+    assert processor.merged_df['id'].tolist() == [5, 5, 3, 1]
+    assert processor.merged_df['score'].tolist() == [50, 50, 30, 10]
@@ -0,0 +1,15 @@
+import pandas as pd
+import pytest
+
+from app import _write_csv
+
+
+@pytest.mark.parametrize('df', [
+    pd.DataFrame({'id': [1, 2], 'h,dr': ['a', 'x,y'], 'note': ['', None]}),
+    pd.DataFrame({'id': [1, 2], 'name': ['a b', 'c'], 'n': pd.array([1, None], dtype='Int64')}),
+    pd.DataFrame({'flag': [True, False], 'x': [1.0, 2.5]}),
+    pd.DataFrame({'ts': pd.to_datetime(['2020-01-02', '2020-01-03']), 'dt': pd.to_timedelta([1, 2], unit='s')}),
+    pd.DataFrame({'only': ['', 'a']}),
+])
+def test_write_csv_matches_to_csv(df):
+    assert _write_csv(df) == df.to_csv(index=False).encode('utf-8')
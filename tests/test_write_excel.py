@@ -0,0 +1,26 @@
+import io
+
+import numpy as np
+import openpyxl
+import pandas as pd
+
+from app import _write_excel
+
+
+def test_write_excel_writes_infinite_floats_as_text():
+    df = pd.DataFrame({
+        'x': [1.5, np.inf, -np.inf, np.nan],
+        'y': pd.array([np.inf, 2.0, None, -np.inf], dtype='Float64'),
+        'name': ['a', 'b', 'c', 'd'],
+    })
+
+    sheet = openpyxl.load_workbook(io.BytesIO(_write_excel(df))).active
+    rows = list(sheet.iter_rows(values_only=True))
+
+    assert rows == [
+        ('x', 'y', 'name'),
+        (1.5, 'inf', 'a'),
+        ('inf', 2, 'b'),
+        ('-inf', None, 'c'),
+        (None, '-inf', 'd'),
+    ]
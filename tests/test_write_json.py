@@ -0,0 +1,33 @@
+import json
+
+import pandas as pd
+import pytest
+
+import app
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({
+        'ts': pd.to_datetime(['2020-01-02 03:04:05.123', None]),
+        'utc': pd.to_datetime(['2020-01-02', '2020-01-03'], utc=True),
+        'delta': pd.to_timedelta(['1 day 2.5s', None]),
+        'n': [1, 2],
+    })
+
+
+EXPECTED = [
+    {'ts': '2020-01-02T03:04:05.123', 'utc': '2020-01-02T00:00:00.000Z', 'delta': 'P1DT0H0M2.500S', 'n': 1},
+    {'ts': None, 'utc': '2020-01-03T00:00:00.000Z', 'delta': None, 'n': 2},
+]
+
+
+@pytest.mark.skipif(app.orjson is None, reason='orjson not installed')
+def test_orjson_path_writes_iso_dates(frame):
+    assert json.loads(app._write_json(frame)) == EXPECTED
+
+
+def test_pandas_fallback_writes_iso_dates(frame, monkeypatch):
+    monkeypatch.setattr(app, 'orjson', None)
+
+    assert json.loads(app._write_json(frame)) == EXPECTED